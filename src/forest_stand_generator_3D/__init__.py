@@ -1,13 +1,26 @@
 __version__ = "0.1.0"
 
-from .stand import generate_stand
-from .visualization import plot_forest_stand, plot_forest_top_view
-from .export import export_forest_stand_to_json, export_forest_stand_to_csv
+from .stand import generate_stand, generate_stand_arrays
+from .visualization import (
+    plot_forest_stand,
+    plot_forest_top_view,
+    plot_forest_stand_piviz,
+)
+from .export import (
+    export_forest_stand_to_json,
+    export_forest_stand_to_csv,
+    export_forest_stand_to_npz,
+    export_forest_stand_to_parquet,
+)
 
 __all__ = [
     "generate_stand",
+    "generate_stand_arrays",
     "plot_forest_stand",
     "plot_forest_top_view",
+    "plot_forest_stand_piviz",
     "export_forest_stand_to_json",
     "export_forest_stand_to_csv",
+    "export_forest_stand_to_npz",
+    "export_forest_stand_to_parquet",
 ]
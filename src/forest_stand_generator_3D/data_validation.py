@@ -126,7 +126,13 @@ def validate_tree_params(tree_params_list):
 
 
 def validate_stand_params(
-    plot_width, plot_length, n_trees, placement, tree_params_list, min_spacing=None
+    plot_width,
+    plot_length,
+    n_trees,
+    placement,
+    tree_params_list,
+    min_spacing=None,
+    n_jobs=1,
 ):
     """
     Validate all parameters required for generating a forest stand.
@@ -138,7 +144,8 @@ def validate_stand_params(
       2. Number of trees (n_trees) is non-negative.
       3. Tree placement type is either 'uniform' or 'random'.
       4. If placement is 'random', minimum spacing between trees (min_spacing) is positive.
-      5. Each tree's parameters in tree_params_list are valid (calls `validate_tree_params`).
+      5. The number of worker processes (n_jobs) is a positive integer or -1.
+      6. Each tree's parameters in tree_params_list are valid (calls `validate_tree_params`).
 
     Raises
     ------
@@ -148,6 +155,7 @@ def validate_stand_params(
           - n_trees < 0
           - placement is not 'uniform' or 'random'
           - min_spacing <= 0 when placement='random'
+          - n_jobs is not a positive integer or -1
           - Any tree parameter in tree_params_list is invalid
 
     Parameters
@@ -168,6 +176,9 @@ def validate_stand_params(
     min_spacing : float
         Minimum allowed spacing between trees (used only if placement='random').
         Must be > 0 when placement='random'.
+    n_jobs : int
+        Number of worker processes used for tree generation. Must be >= 1,
+        or -1 to use all CPU cores.
     """
 
     # Validate plot dimensions
@@ -202,6 +213,9 @@ def validate_stand_params(
         if min_spacing <= 0:
             raise ValueError("min_spacing must be > 0 when placement='random'")
 
+    # Validate number of worker processes
+    validate_n_jobs(n_jobs)
+
     # Validate per-tree parameters using the previously defined function
     validate_tree_params(tree_params_list)
 
@@ -209,3 +223,8 @@ def validate_stand_params(
 def validate_plot(plot_width, plot_length):
     if plot_width <= 0 or plot_length <= 0:
         raise ValueError("Plot width and length must be positive numbers.")
+
+
+def validate_n_jobs(n_jobs):
+    if not isinstance(n_jobs, int) or (n_jobs < 1 and n_jobs != -1):
+        raise ValueError(f"n_jobs must be a positive integer or -1, got {n_jobs}")
@@ -2,6 +2,12 @@
 
 import json
 import numpy as np
+from .tree import _leaf_arrays
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None  # type: ignore[assignment]
 
 
 class NumpyEncoder(json.JSONEncoder):
@@ -18,6 +24,51 @@ class NumpyEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+def _stand_to_columns(stand: list) -> dict:
+    """
+    Flatten a forest stand into per-row column arrays.
+
+    Rows follow the CSV layout: each tree contributes its trunk row followed
+    by one row per leaf. Trunk rows carry the base position and a zero normal.
+    """
+    n_leaves = np.array(
+        [len(tree["leaves"]["radii"]) for tree in stand], dtype=np.int64
+    )
+    rows_per_tree = n_leaves + 1
+    n_rows = int(rows_per_tree.sum())
+
+    # Index of each tree's trunk row; every other row is a leaf
+    trunk_rows = np.cumsum(rows_per_tree) - rows_per_tree
+    is_trunk = np.zeros(n_rows, dtype=bool)
+    is_trunk[trunk_rows] = True
+    is_leaf = ~is_trunk
+
+    position = np.zeros((n_rows, 3), dtype=np.float32)
+    normal = np.zeros((n_rows, 3), dtype=np.float32)
+    radius = np.zeros(n_rows, dtype=np.float32)
+
+    if stand:
+        position[trunk_rows] = [tree["trunk"]["base"] for tree in stand]
+        radius[trunk_rows] = [tree["trunk"]["radius"] for tree in stand]
+        # Coerced per tree so a reloaded stand (plain lists) stacks cleanly
+        centers, normals, radii = zip(*(_leaf_arrays(t["leaves"]) for t in stand))
+        position[is_leaf] = np.concatenate(centers)
+        normal[is_leaf] = np.concatenate(normals)
+        radius[is_leaf] = np.concatenate(radii)
+
+    return {
+        "tree_id": np.repeat(np.arange(len(stand), dtype=np.int32), rows_per_tree),
+        "type": np.where(is_trunk, "trunk", "leaf"),
+        "x": position[:, 0],
+        "y": position[:, 1],
+        "z": position[:, 2],
+        "radius": radius,
+        "nx": normal[:, 0],
+        "ny": normal[:, 1],
+        "nz": normal[:, 2],
+    }
+
+
 def export_forest_stand_to_json(stand: list, filename: str):
     """
     Export a forest stand to a JSON file.
@@ -31,7 +82,7 @@ def export_forest_stand_to_json(stand: list, filename: str):
         Forest stand data structure.
         Each element represents a tree and contains:
             - trunk: base position, height, radius
-            - leaves: list of leaf objects with center, radius, and normal
+            - leaves: per-leaf arrays of centers, normals, and radii
     filename : str
         Name of the output JSON file (e.g. "forest_stand.json").
 
@@ -39,7 +90,19 @@ def export_forest_stand_to_json(stand: list, filename: str):
     -----
     NumPy arrays inside the stand structure are automatically
     converted to standard Python lists.
+
+    When `orjson` is installed it is used to serialize the stand, encoding
+    NumPy arrays natively in C (indented with 2 spaces). Otherwise the
+    standard library `json` module is used with `NumpyEncoder`.
     """
+    if orjson is not None:
+        data = orjson.dumps(
+            stand, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2
+        )
+        with open(filename, "wb") as f:
+            f.write(data)
+        return
+
     with open(filename, "w", encoding="utf-8") as f:
         json.dump(stand, f, indent=4, cls=NumpyEncoder)
 
@@ -77,23 +140,85 @@ def export_forest_stand_to_csv(stand: list, filename: str):
     -----
     Trunks are exported as a single point located at the trunk base.
     Leaf geometry is represented by its center, radius, and normal.
+    Trunk values are written exactly (shortest round-trip repr). Leaf values
+    are float32 and written with nine significant digits ("%.9g"), which
+    reproduces every float32 value exactly when read back.
     """
-    import csv
+    # Leaf columns are written with a fixed format; tree_id and type are
+    # baked into each tree's format string so every leaf block is a single
+    # float table handed to np.savetxt
+    leaf_fmt = ",".join(["%.9g"] * 7)
 
-    with open(filename, "w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(["tree_id", "type", "x", "y", "z", "radius", "nx", "ny", "nz"])
+    with open(filename, "w", buffering=1 << 20) as f:
+        f.write("tree_id,type,x,y,z,radius,nx,ny,nz\n")
 
         for tid, tree in enumerate(stand):
             trunk = tree["trunk"]
             x0, y0, z0 = trunk["base"]
-            r = trunk["radius"]
 
             # Trunk (exported as base point)
-            writer.writerow([tid, "trunk", x0, y0, z0, r, 0, 0, 0])
+            values = ",".join(str(v) for v in (x0, y0, z0, trunk["radius"]))
+            f.write(f"{tid},trunk,{values},0,0,0\n")
+
+            # Leaves (lists from a reloaded JSON stand are accepted too)
+            centers, normals, radii = _leaf_arrays(tree["leaves"])
+            block = np.column_stack((centers, radii, normals))
+            np.savetxt(f, block, fmt=f"{tid},leaf,{leaf_fmt}")
+
+
+def export_forest_stand_to_npz(stand: list, filename: str):
+    """
+    Export forest stand geometry to a compressed NumPy ``.npz`` archive.
+
+    The archive holds one array per column, using the same columns and row
+    order as `export_forest_stand_to_csv`: tree_id, type, x, y, z, radius,
+    nx, ny, nz. Geometry columns are stored as float32.
+
+    Parameters
+    ----------
+    stand : list
+        Forest stand data structure.
+    filename : str
+        Name of the output file (e.g. "forest_stand.npz").
+
+    Notes
+    -----
+    The archive can be read back with ``np.load(filename)``; no pickling
+    is involved.
+    """
+    np.savez_compressed(filename, **_stand_to_columns(stand))
+
+
+def export_forest_stand_to_parquet(stand: list, filename: str):
+    """
+    Export forest stand geometry to a Parquet file.
 
-            # Leaves
-            for leaf in tree["leaves"]:
-                lx, ly, lz = leaf["center"]
-                nx, ny, nz = leaf["normal"]
-                writer.writerow([tid, "leaf", lx, ly, lz, leaf["radius"], nx, ny, nz])
+    The table uses the same columns and row order as
+    `export_forest_stand_to_csv`: tree_id, type, x, y, z, radius, nx, ny, nz.
+    Geometry columns are stored as float32.
+
+    Parameters
+    ----------
+    stand : list
+        Forest stand data structure.
+    filename : str
+        Name of the output file (e.g. "forest_stand.parquet").
+
+    Raises
+    ------
+    ImportError
+        If `pyarrow` is not installed.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError(
+            "export_forest_stand_to_parquet requires pyarrow (pip install pyarrow)"
+        ) from None
+
+    columns = _stand_to_columns(stand)
+    table = pa.Table.from_arrays(
+        [pa.array(values) for values in columns.values()], names=list(columns)
+    )
+    pq.write_table(table, filename)
@@ -1,9 +1,142 @@
 # src/forest_stand_generator/stand.py
 
 import numpy as np
-from typing import List, Dict, Union
+from typing import List, Dict, Optional, Tuple, Union
 from .data_validation import validate_stand_params
-from .tree import generate_tree
+from .tree import _iter_trees, _leaf_count, generate_trees
+
+# One record per tree: trunk base position, height and radius
+_TRUNK_DTYPE = np.dtype(
+    [("base", np.float32, 3), ("height", np.float32), ("radius", np.float32)]
+)
+
+
+def _place_trees(
+    plot_width: float,
+    plot_length: float,
+    n_trees: int,
+    placement: str,
+    min_spacing: float,
+    tree_params: Union[Dict, List[Dict]],
+    n_jobs: int,
+    seed: Optional[int],
+) -> Tuple[List[Dict], np.random.SeedSequence]:
+    """
+    Validate the stand parameters and place the trees on the plot.
+
+    Returns the `generate_tree` keyword arguments of every placed tree
+    (including "position") and the seed sequence that drives the stand.
+    """
+    # Normalize tree_params
+    if isinstance(tree_params, dict):
+        tree_params_list = [tree_params for _ in range(n_trees)]
+    elif isinstance(tree_params, list):
+        tree_params_list = tree_params
+    else:
+        raise ValueError("tree_params must be a dict or a list of dicts")
+
+    validate_stand_params(
+        plot_width=plot_width,
+        plot_length=plot_length,
+        n_trees=n_trees,
+        placement=placement,
+        tree_params_list=tree_params_list,
+        min_spacing=min_spacing,
+        n_jobs=n_jobs,
+    )
+
+    # One seed sequence drives placement and spawns the per-tree streams
+    seed_seq = np.random.SeedSequence(seed)
+    rng = np.random.default_rng(seed_seq)
+
+    positions = []
+
+    def get_tree_params(i):
+        return tree_params_list[i]
+
+    # UNIFORM PLACEMENT
+    if placement == "uniform":
+        # compute maximum trunk radius
+        radii = [params["trunk_radius"] for params in tree_params_list]
+        max_radius = max(radii)
+        min_required_spacing = 2 * max_radius
+
+        # Grid layout
+        n_cols = int(np.ceil(np.sqrt(n_trees * plot_width / plot_length)))
+        n_rows = int(np.ceil(n_trees / n_cols))
+        x_spacing = plot_width / n_cols
+        y_spacing = plot_length / n_rows
+
+        # enforce no trunk overlap
+        if x_spacing < min_required_spacing or y_spacing < min_required_spacing:
+            raise ValueError(
+                "Uniform placement failed: plot too small to avoid trunk area overlap."
+            )
+
+        # Column-major grid cell centers; the first n_trees cells are used
+        positions = [
+            [x_spacing * (i + 0.5), y_spacing * (j + 0.5), 0.0]
+            for i in range(n_cols)
+            for j in range(n_rows)
+        ][:n_trees]
+
+    # RANDOM PLACEMENT
+    elif placement == "random":
+        max_attempts = n_trees * 50
+
+        # Candidates are drawn n_trees at a time (one RNG call per coordinate
+        # and batch); placement usually finishes within the first few batches
+        batch_size = n_trees
+
+        # Spatial hash of accepted trunks. The cell size bounds every required
+        # distance, so only the 3x3 block of cells around a candidate is checked.
+        max_radius = max(params["trunk_radius"] for params in tree_params_list)
+        cell_size = max(min_spacing, 2 * max_radius)
+        grid: Dict[Tuple[int, int], List[Tuple[float, float, float]]] = {}
+
+        def is_far_enough(x, y, new_radius):
+            cx, cy = int(x // cell_size), int(y // cell_size)
+            for gx in range(cx - 1, cx + 2):
+                for gy in range(cy - 1, cy + 2):
+                    for px, py, r in grid.get((gx, gy), ()):
+                        required = max(min_spacing, new_radius + r)
+                        if (x - px) ** 2 + (y - py) ** 2 < required * required:
+                            return False
+            return True
+
+        for _ in range(0, max_attempts, batch_size):
+            if len(positions) >= n_trees:
+                break
+
+            xs = rng.uniform(0, plot_width, batch_size).tolist()
+            ys = rng.uniform(0, plot_length, batch_size).tolist()
+
+            for x, y in zip(xs, ys):
+                if len(positions) >= n_trees:
+                    break
+
+                idx = len(positions)
+                new_radius = get_tree_params(idx)["trunk_radius"]
+
+                # radius-aware distance check
+                if is_far_enough(x, y, new_radius):
+                    positions.append([x, y, 0.0])
+                    cell = (int(x // cell_size), int(y // cell_size))
+                    grid.setdefault(cell, []).append((x, y, new_radius))
+
+        if len(positions) < n_trees:
+            print(
+                f"Warning: Only {len(positions)} trees placed due to spacing constraints."
+            )
+
+    else:
+        raise ValueError("Unsupported placement type. Choose 'uniform' or 'random'.")
+
+    params_list = [
+        dict(params, position=position)
+        for params, position in zip(tree_params_list, positions)
+    ]
+    return params_list, seed_seq
 
 
 def generate_stand(
@@ -13,6 +146,8 @@ def generate_stand(
     placement: str,
     min_spacing: float,
     tree_params: Union[Dict, List[Dict]],
+    n_jobs: int = 1,
+    seed: Optional[int] = None,
 ) -> List[Dict]:
     """
     Generate a forest stand (collection of trees) on a rectangular plot.
@@ -42,6 +177,14 @@ def generate_stand(
         - dict: the same parameters are applied to all trees.
         - list of dicts: a separate parameter set for each tree.
           Length must equal n_trees.
+    n_jobs : int, optional
+        Number of worker processes used to generate the trees once their
+        positions are fixed. 1 (default) runs serially; -1 uses all CPU cores.
+    seed : int, optional
+        Seed for the stand's random streams. The same seed reproduces the same
+        stand, whether or not numba is installed and for any `n_jobs`; only
+        the "cupy" backend samples leaves differently. None (default) draws
+        fresh entropy from the operating system.
 
     Returns
     -------
@@ -60,103 +203,94 @@ def generate_stand(
     - For "random" placement, if the requested number of trees cannot be placed
       due to spacing constraints, fewer trees may be generated and a warning
       is printed.
+    - Each tree draws from its own random stream spawned from a
+      `np.random.SeedSequence`, so trees are statistically independent and
+      the result does not depend on `n_jobs`. Placement and the per-tree
+      streams all derive from one `SeedSequence(seed)`.
     """
 
-    # Normalize tree_params
-    if isinstance(tree_params, dict):
-        tree_params_list = [tree_params for _ in range(n_trees)]
-    elif isinstance(tree_params, list):
-        tree_params_list = tree_params
-    else:
-        raise ValueError("tree_params must be a dict or a list of dicts")
-
-    validate_stand_params(
+    params_list, seed_seq = _place_trees(
         plot_width=plot_width,
         plot_length=plot_length,
         n_trees=n_trees,
         placement=placement,
-        tree_params_list=tree_params_list,
         min_spacing=min_spacing,
+        tree_params=tree_params,
+        n_jobs=n_jobs,
+        seed=seed,
     )
 
-    tree_list = []
+    # Tree generation is independent per tree once positions are fixed
+    return generate_trees(params_list, n_jobs=n_jobs, seed=seed_seq)
 
-    def get_tree_params(i):
-        return tree_params_list[i]
-
-    # UNIFORM PLACEMENT
-    if placement == "uniform":
-        # compute maximum trunk radius
-        radii = [params["trunk_radius"] for params in tree_params_list]
-        max_radius = max(radii)
-        min_required_spacing = 2 * max_radius
-
-        # Grid layout
-        n_cols = int(np.ceil(np.sqrt(n_trees * plot_width / plot_length)))
-        n_rows = int(np.ceil(n_trees / n_cols))
-        x_spacing = plot_width / n_cols
-        y_spacing = plot_length / n_rows
 
-        # enforce no trunk overlap
-        if x_spacing < min_required_spacing or y_spacing < min_required_spacing:
-            raise ValueError(
-                "Uniform placement failed: plot too small to avoid trunk area overlap."
-            )
-
-        count = 0
-        for i in range(n_cols):
-            for j in range(n_rows):
-                if count >= n_trees:
-                    break
-
-                x = x_spacing * (i + 0.5)
-                y = y_spacing * (j + 0.5)
-                position = [x, y, 0.0]
-
-                tree = generate_tree(position=position, **get_tree_params(count))
-                tree_list.append(tree)
-                count += 1
+def generate_stand_arrays(
+    plot_width: float,
+    plot_length: float,
+    n_trees: int,
+    placement: str,
+    min_spacing: float,
+    tree_params: Union[Dict, List[Dict]],
+    n_jobs: int = 1,
+    seed: Optional[int] = None,
+) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """
+    Generate a forest stand as flat NumPy arrays instead of per-tree dicts.
 
-    # RANDOM PLACEMENT
-    elif placement == "random":
-        attempts = 0
-        max_attempts = n_trees * 50
-        positions = []
-        radii = []
-
-        while len(positions) < n_trees and attempts < max_attempts:
-            x = np.random.uniform(0, plot_width)
-            y = np.random.uniform(0, plot_length)
-            pos = np.array([x, y])
-
-            idx = len(tree_list)
-            new_radius = get_tree_params(idx)["trunk_radius"]
-
-            # radius-aware distance check
-            valid = True
-            for p, r in zip(positions, radii):
-                d = np.linalg.norm(pos - np.array(p[:2]))
-                required = max(min_spacing, new_radius + r)
-                if d < required:
-                    valid = False
-                    break
+    Takes the same arguments as `generate_stand`. The whole stand is packed
+    into one structured trunk array and one set of leaf arrays, which is
+    cheaper to keep around and faster to process for large stands than a
+    list of per-tree dictionaries. The output arrays are allocated once from
+    the LAI-derived leaf counts and filled as trees are generated, so only
+    one tree's leaves are held alongside them at a time (plus any finished
+    but not yet consumed trees when `n_jobs` is not 1).
 
-            if valid:
-                position = [x, y, 0.0]
-                positions.append(position)
-                radii.append(new_radius)
+    Returns
+    -------
+    trunks : np.ndarray
+        Structured array with one record per tree and fields "base"
+        (float32, shape 3), "height" and "radius" (float32).
+    leaves : Dict[str, np.ndarray]
+        Leaves of all trees, concatenated in tree order:
+            - "tree_id": (n_leaves,) int32 index of the owning tree.
+            - "centers": (n_leaves, 3) float32 leaf positions.
+            - "normals": (n_leaves, 3) float32 leaf orientations.
+            - "radii": (n_leaves,) float32 leaf radii.
+    """
+    params_list, seed_seq = _place_trees(
+        plot_width=plot_width,
+        plot_length=plot_length,
+        n_trees=n_trees,
+        placement=placement,
+        min_spacing=min_spacing,
+        tree_params=tree_params,
+        n_jobs=n_jobs,
+        seed=seed,
+    )
 
-                tree = generate_tree(position=position, **get_tree_params(idx))
-                tree_list.append(tree)
+    # Leaf counts are known from the parameters, so the output is allocated
+    # once and filled tree by tree; each tree's arrays are dropped right away
+    counts = [
+        _leaf_count(p["lai"], p["crown_radius"], p["leaf_radius_params"]["mean"])
+        for p in params_list
+    ]
+    offsets = np.concatenate(([0], np.cumsum(counts)))
+    n_leaves = int(offsets[-1])
 
-            attempts += 1
+    trunks = np.empty(len(params_list), dtype=_TRUNK_DTYPE)
+    leaves = {
+        "tree_id": np.repeat(np.arange(len(params_list), dtype=np.int32), counts),
+        "centers": np.empty((n_leaves, 3), dtype=np.float32),
+        "normals": np.empty((n_leaves, 3), dtype=np.float32),
+        "radii": np.empty(n_leaves, dtype=np.float32),
+    }
 
-        if len(tree_list) < n_trees:
-            print(
-                f"Warning: Only {len(tree_list)} trees placed due to spacing constraints."
-            )
+    for tid, tree in enumerate(_iter_trees(params_list, n_jobs, seed_seq)):
+        trunk = tree["trunk"]
+        trunks[tid] = (trunk["base"], trunk["height"], trunk["radius"])
 
-    else:
-        raise ValueError("Unsupported placement type. Choose 'uniform' or 'random'.")
+        start, stop = offsets[tid], offsets[tid + 1]
+        for key in ("centers", "normals", "radii"):
+            leaves[key][start:stop] = tree["leaves"][key]
 
-    return tree_list
+    return trunks, leaves
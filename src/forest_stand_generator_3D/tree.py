@@ -1,31 +1,327 @@
 # src/forest_stand_generator/tree.py
 
+import os
+import multiprocessing
 import numpy as np
-from typing import Dict, List
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Union
+from .data_validation import validate_n_jobs
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional
+    njit = prange = None  # type: ignore[assignment, misc]
+
+# Shared PCG64 generator; faster than the legacy global RandomState
+_rng = np.random.default_rng()
+
+# Array module used for leaf sampling; switched with `set_backend`
+_xp = np
+
+# Sample each tree's leaves with the multithreaded numba kernel; switched
+# with `set_backend`
+_parallel_leaves = False
+
+# Set once the parallel kernels were selected: numba's thread pool may be
+# running from then on, and forking it can hang (e.g. with TBB)
+_leaf_threads_started = False
+
+# Integer codes passed to the leaf sampling kernels
+_SHAPE_CODES = {"sphere": 0, "sphere_w_LH": 1, "cylinder": 2, "cone": 3}
+_DISTRIBUTION_CODES = {"uniform": 0, "spherical": 0, "planophile": 1, "erectophile": 2}
+
+# Fixed leaf normals, allocated once and write-protected
+_PLANOPHILE = np.array([0.0, 0.0, 1.0], dtype=np.float32)
+_PLANOPHILE.setflags(write=False)
+_ERECTOPHILE = np.array([1.0, 0.0, 0.0], dtype=np.float32)
+_ERECTOPHILE.setflags(write=False)
+_CONST_NORMALS = {"planophile": _PLANOPHILE, "erectophile": _ERECTOPHILE}
+
+
+def _shape_code(shape):
+    try:
+        return _SHAPE_CODES[shape]
+    except KeyError:
+        raise ValueError("Unsupported crown shape") from None
+
+
+def _distribution_code(distribution):
+    try:
+        return _DISTRIBUTION_CODES[distribution]
+    except KeyError:
+        raise ValueError("Unknown leaf angle distribution") from None
+
+
+# ==============================================================
+# LEAF SAMPLING KERNELS
+# ==============================================================
+# `_crown_point` maps uniform variates in [0, 1) to a crown sample and works
+# elementwise on scalars or arrays, so the vectorized NumPy path and the
+# compiled per-leaf kernels share the same geometry. NumPy ufuncs dispatch to
+# CuPy for device arrays, so the same transform also runs on the GPU.
+
+
+def _crown_point(shape_code, height, radius, u1, u2, u3):
+    if shape_code <= 1:
+        # Sphere: cbrt of the radial variate gives uniform density in volume,
+        # and the direction is uniform on the unit sphere (no rejection)
+        r = radius * np.cbrt(u1)
+        cos_theta = 2 * u2 - 1
+        if shape_code == 1:
+            cos_theta = np.abs(cos_theta)  # upper hemisphere only
+        sin_theta = np.sqrt(1 - cos_theta**2)
+        phi = 2 * np.pi * u3
+        return (
+            r * sin_theta * np.cos(phi),
+            r * sin_theta * np.sin(phi),
+            r * cos_theta * height / radius,
+        )
+
+    if shape_code == 2:
+        # Cylinder: constant cross-section, so height is uniform
+        z = height * u3
+        r_max = radius
+    else:
+        # Cone: the cross-section shrinks as (1 - z/height)**2, so invert
+        # that height CDF instead of drawing z uniformly
+        z = height * (1 - np.cbrt(u3))
+        r_max = radius * (1 - z / height)
+    r = r_max * np.sqrt(u1)
+    theta = 2 * np.pi * u2
+    return r * np.cos(theta), r * np.sin(theta), z
+
+
+def _unit_gaussian_normals(n, rng, xp=np):
+    # Isotropic Gaussian vectors normalized to length one are uniformly
+    # distributed on the unit sphere
+    normals = rng.standard_normal((n, 3), dtype=xp.float32)
+    normals *= (1 / xp.sqrt(xp.einsum("ij,ij->i", normals, normals)))[:, None]
+    return normals
+
+
+def _crown_points(shape_code, height, radius, n, rng, xp=np):
+    points = xp.empty((n, 3), dtype=xp.float32)
+    u1, u2, u3 = rng.random((3, n), dtype=xp.float32)
+    points[:, 0], points[:, 1], points[:, 2] = _crown_point(
+        shape_code, height, radius, u1, u2, u3
+    )
+    return points
+
+
+def _leaf_normals(distribution_code, n, rng, xp=np):
+    if distribution_code == 0:
+        # Random direction on unit sphere
+        return _unit_gaussian_normals(n, rng, xp)
+    elif distribution_code == 1:
+        # Mostly horizontal leaves
+        normal = _PLANOPHILE
+    else:
+        # Mostly vertical leaves
+        normal = _ERECTOPHILE
+    # Materialize the rows so tree arrays stay contiguous and writable
+    return xp.broadcast_to(xp.asarray(normal), (n, 3)).copy()
+
+
+if njit is not None:
+    _crown_point_jit = njit(cache=True, fastmath=True)(_crown_point)
+
+    # The compiled kernels run on variates drawn up front from the tree's
+    # stream, in the same order as the NumPy samplers, so a seed gives the
+    # same leaves with or without numba
+    @njit(cache=True, fastmath=True)
+    def _crown_points_compiled(shape_code, crown_height, crown_radius, bx, by, bz, u):
+        n = u.shape[1]
+        centers = np.empty((n, 3), dtype=np.float32)
+        for i in range(n):
+            x, y, z = _crown_point_jit(
+                shape_code, crown_height, crown_radius, u[0, i], u[1, i], u[2, i]
+            )
+            centers[i, 0] = x + bx
+            centers[i, 1] = y + by
+            centers[i, 2] = z + bz
+        return centers
+
+    @njit(cache=True, fastmath=True)
+    def _normalize_rows_compiled(vectors):
+        for i in range(vectors.shape[0]):
+            nx, ny, nz = vectors[i, 0], vectors[i, 1], vectors[i, 2]
+            inv_norm = 1.0 / np.sqrt(nx * nx + ny * ny + nz * nz)
+            vectors[i, 0] = nx * inv_norm
+            vectors[i, 1] = ny * inv_norm
+            vectors[i, 2] = nz * inv_norm
+        return vectors
+
+    # Threaded twins of the kernels above; a Generator cannot be shared
+    # between prange threads, which is why both take pre-drawn variates
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _crown_points_parallel(shape_code, crown_height, crown_radius, bx, by, bz, u):
+        n = u.shape[1]
+        centers = np.empty((n, 3), dtype=np.float32)
+        for i in prange(n):
+            x, y, z = _crown_point_jit(
+                shape_code, crown_height, crown_radius, u[0, i], u[1, i], u[2, i]
+            )
+            centers[i, 0] = x + bx
+            centers[i, 1] = y + by
+            centers[i, 2] = z + bz
+        return centers
+
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _normalize_rows_parallel(vectors):
+        for i in prange(vectors.shape[0]):
+            nx, ny, nz = vectors[i, 0], vectors[i, 1], vectors[i, 2]
+            inv_norm = 1.0 / np.sqrt(nx * nx + ny * ny + nz * nz)
+            vectors[i, 0] = nx * inv_norm
+            vectors[i, 1] = ny * inv_norm
+            vectors[i, 2] = nz * inv_norm
+        return vectors
+
+
+def _gen_leaves(
+    shape_code, n, crown_height, crown_radius, bx, by, bz, distribution_code, rng
+):
+    """
+    Sample leaf centers (in world space) and normals for one tree.
+
+    Runs the vectorized samplers on the GPU when the CuPy backend is
+    selected, and the multithreaded numba kernels when the "numba_parallel"
+    backend is. Otherwise runs the serial numba kernels when numba is
+    installed, falling back to the vectorized NumPy samplers. The numba
+    kernels draw from `rng` in the same order as the NumPy samplers, so a
+    seeded `rng` gives the same leaves with or without numba; the GPU draws
+    from its own device generator.
+    """
+    if _xp is not np:
+        # Seed the device generator from the host stream so results stay
+        # reproducible for a seeded `rng`
+        xp = _xp
+        device_rng = xp.random.default_rng(int(rng.integers(2**63)))
+        centers = _crown_points(
+            shape_code, crown_height, crown_radius, n, device_rng, xp
+        )
+        centers += xp.asarray([bx, by, bz], dtype=xp.float32)
+        normals = _leaf_normals(distribution_code, n, device_rng, xp)
+        return centers.get(), normals.get()
+
+    if njit is not None:
+        if _parallel_leaves:
+            crown_points, normalize_rows = (
+                _crown_points_parallel,
+                _normalize_rows_parallel,
+            )
+        else:
+            crown_points, normalize_rows = (
+                _crown_points_compiled,
+                _normalize_rows_compiled,
+            )
+        u = rng.random((3, n), dtype=np.float32)
+        centers = crown_points(shape_code, crown_height, crown_radius, bx, by, bz, u)
+        if distribution_code == 0:
+            normals = normalize_rows(rng.standard_normal((n, 3), dtype=np.float32))
+        else:
+            normals = _leaf_normals(distribution_code, n, rng)
+        return centers, normals
+
+    centers = _crown_points(shape_code, crown_height, crown_radius, n, rng)
+    centers += np.array([bx, by, bz], dtype=centers.dtype)
+    normals = _leaf_normals(distribution_code, n, rng)
+    return centers, normals
+
+
+def set_backend(backend: str):
+    """
+    Select the array backend used to sample leaves.
+
+    Parameters
+    ----------
+    backend : str
+        - "numpy" (default): sample on the CPU, using compiled numba
+          kernels when numba is installed. They draw the same variates as
+          the NumPy samplers, so seeded results do not depend on numba.
+        - "cupy": sample leaf positions and normals on a CUDA GPU with CuPy.
+          Results are copied back to NumPy arrays, so trees have the same
+          layout as with the CPU backend. CUDA cannot be used from forked
+          worker processes, so `generate_trees` and `generate_stand` run
+          serially (ignoring `n_jobs`) while this backend is selected.
+        - "numba_parallel": sample each tree's leaves on the CPU with numba
+          kernels that spread the leaves over threads (see
+          `numba.set_num_threads`). The tree's variates are drawn up front,
+          in the same order as the NumPy samplers. Threads already use every
+          core, so `generate_trees` and `generate_stand` run serially
+          (ignoring `n_jobs`) while this backend is selected. Worth it for
+          trees with many leaves on multi-core machines; on one core it is
+          slower than the default serial kernels. Once it has been selected,
+          later parallel runs start their workers with "spawn" instead of
+          forking numba's running thread pool, so scripts need the usual
+          `if __name__ == "__main__":` guard.
+
+    Raises
+    ------
+    ValueError
+        If an unknown backend is provided.
+    ImportError
+        If "cupy" is requested but CuPy is not installed, or
+        "numba_parallel" is requested but numba is not installed.
+    """
+    global _xp, _parallel_leaves, _leaf_threads_started
+
+    if backend == "numpy":
+        _xp = np
+        _parallel_leaves = False
+    elif backend == "numba_parallel":
+        if njit is None:
+            raise ImportError(
+                "the numba_parallel backend requires numba (pip install numba)"
+            )
+        _xp = np
+        _parallel_leaves = True
+        _leaf_threads_started = True
+    elif backend == "cupy":
+        try:
+            import cupy
+        except ImportError:
+            raise ImportError(
+                "the cupy backend requires CuPy "
+                "(pip install cupy-cuda12x, matching your CUDA version)"
+            ) from None
+        _xp = cupy
+        _parallel_leaves = False
+    else:
+        raise ValueError(
+            "Unsupported backend. Choose 'numpy', 'numba_parallel' or 'cupy'."
+        )
 
 
-def sample_leaf_normal(distribution: str) -> np.ndarray:
+def sample_leaf_normals(
+    distribution: str, n: int, rng: Optional[np.random.Generator] = None
+) -> np.ndarray:
     """
-    Sample a 3D leaf normal vector according to a specified leaf angle distribution.
+    Sample 3D leaf normal vectors according to a specified leaf angle distribution.
 
-    The leaf normal vector represents the orientation of a leaf in 3D space
-    and is returned as a unit vector [x, y, z].
+    Each leaf normal vector represents the orientation of a leaf in 3D space.
+    All `n` normals are generated in a single vectorized call.
 
     Parameters
     ----------
     distribution : str
         Leaf angle distribution type. Supported values:
-        - "uniform" or "spherical": samples a random direction uniformly
+        - "uniform" or "spherical": samples random directions uniformly
         over the surface of the unit sphere.
         - "planophile": leaves are mostly horizontal, with the normal pointing
         upward along the z-axis ([0, 0, 1]).
         - "erectophile": leaves are mostly vertical, with the normal pointing
         along the x-axis ([1, 0, 0]).
+    n : int
+        Number of normals to sample.
+    rng : np.random.Generator, optional
+        Random generator to draw from. Defaults to the shared module-level
+        generator.
 
     Returns
     -------
     np.ndarray
-        A 3-element unit vector [x, y, z] representing the leaf normal.
+        An (n, 3) float32 array of unit vectors [x, y, z] representing
+        leaf normals.
 
     Raises
     ------
@@ -34,36 +330,64 @@ def sample_leaf_normal(distribution: str) -> np.ndarray:
 
     Notes
     -----
-    - For "uniform"/"spherical", the returned vector is a random point on the
+    - For "uniform"/"spherical", each row is a random point on the
     unit sphere, representing a completely random leaf orientation.
-    - For "planophile" and "erectophile", the returned vector is fixed along
+    - For "planophile" and "erectophile", every row is fixed along
     the principal axis (z or x) and not random.
     """
-    if distribution in ("uniform", "spherical"):
-        # Random direction on unit sphere
-        phi = np.random.uniform(0, 2 * np.pi)
-        cos_theta = np.random.uniform(-1, 1)
-        sin_theta = np.sqrt(1 - cos_theta**2)
-        return np.array([sin_theta * np.cos(phi), sin_theta * np.sin(phi), cos_theta])
+    if rng is None:
+        rng = _rng
+    return _leaf_normals(_distribution_code(distribution), n, rng)
 
-    elif distribution == "planophile":
-        # Mostly horizontal leaves
-        return np.array([0.0, 0.0, 1.0])
 
-    elif distribution == "erectophile":
-        # Mostly vertical leaves
-        return np.array([1.0, 0.0, 0.0])
+def sample_leaf_normal(
+    distribution: str, rng: Optional[np.random.Generator] = None
+) -> np.ndarray:
+    """
+    Sample a single 3D leaf normal vector.
 
-    else:
-        raise ValueError("Unknown leaf angle distribution")
+    Convenience wrapper around `sample_leaf_normals` for one leaf.
 
+    Parameters
+    ----------
+    distribution : str
+        Leaf angle distribution type: "uniform", "spherical",
+        "planophile" or "erectophile".
+    rng : np.random.Generator, optional
+        Random generator to draw from. Defaults to the shared module-level
+        generator.
+
+    Returns
+    -------
+    np.ndarray
+        A 3-element unit vector [x, y, z] representing the leaf normal.
+        For "planophile" and "erectophile" this is a shared read-only
+        array; copy it before modifying.
 
-def sample_point_in_crown(shape: str, height: float, radius: float) -> np.ndarray:
+    Raises
+    ------
+    ValueError
+        If an unknown distribution type is provided.
+    """
+    normal = _CONST_NORMALS.get(distribution)
+    if normal is not None:
+        return normal
+    return sample_leaf_normals(distribution, 1, rng)[0]
+
+
+def sample_points_in_crown(
+    shape: str,
+    height: float,
+    radius: float,
+    n: int,
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
     """
-    Sample a random point inside a tree crown volume of a specified shape.
+    Sample random points inside a tree crown volume of a specified shape.
 
-    The function generates a 3D point [x, y, z] randomly distributed inside
-    the crown volume. The crown shapes can be spherical, cylindrical, or conical.
+    All points are generated in a single vectorized pass, which is much
+    faster than drawing them one at a time when a crown holds thousands
+    of leaves.
 
     Parameters
     ----------
@@ -82,12 +406,17 @@ def sample_point_in_crown(shape: str, height: float, radius: float) -> np.ndarra
         z-coordinates are scaled so that the total height equals this value.
     radius : float
         Maximum horizontal radius of the crown in the xy-plane.
+    n : int
+        Number of points to sample.
+    rng : np.random.Generator, optional
+        Random generator to draw from. Defaults to the shared module-level
+        generator.
 
     Returns
     -------
     np.ndarray
-        A 3-element array [x, y, z] representing the coordinates of a point
-        randomly sampled inside the crown volume.
+        An (n, 3) float32 array of [x, y, z] coordinates randomly sampled
+        inside the crown volume.
 
     Raises
     ------
@@ -96,43 +425,64 @@ def sample_point_in_crown(shape: str, height: float, radius: float) -> np.ndarra
 
     Notes
     -----
-    - For "sphere" and "sphere_w_LH", the point is sampled uniformly inside a
-      unit sphere, then scaled to match the crown height.
+    - For "sphere" and "sphere_w_LH", points are sampled directly in spherical
+      coordinates (radius ~ cbrt(rand), uniform direction), giving uniform
+      density inside the sphere without rejection, then scaled to match the
+      crown height.
     - For "sphere_w_LH", only the upper hemisphere (z ≥ 0) is used.
     - For "cylinder" and "cone", radial distance is sampled using sqrt(rand)
       to ensure uniform density across the cross-sectional area.
+    - For "cone", the height is drawn from its inverse CDF,
+      z = height * (1 - cbrt(rand)), so density is uniform in volume rather
+      than concentrated towards the apex.
     - This function assumes the crown is centered at the origin and extends
       along the positive z-axis.
     """
-    if shape == "sphere":
-        while True:
-            point = np.random.uniform(-radius, radius, size=3)
-            if np.linalg.norm(point) <= radius:
-                point[2] = point[2] * height / radius
-                return point
-
-    if shape == "sphere_w_LH":
-        while True:
-            point = np.random.uniform(-radius, radius, size=3)
-            if np.linalg.norm(point) <= radius:
-                point[2] = abs(point[2]) * height / radius
-                return point
-
-    elif shape == "cylinder":
-        r = radius * np.sqrt(np.random.rand())
-        theta = np.random.uniform(0, 2 * np.pi)
-        z = np.random.uniform(0, height)
-        return np.array([r * np.cos(theta), r * np.sin(theta), z])
-
-    elif shape == "cone":
-        z = np.random.uniform(0, height)
-        r_max = radius * (1 - z / height)
-        r = r_max * np.sqrt(np.random.rand())
-        theta = np.random.uniform(0, 2 * np.pi)
-        return np.array([r * np.cos(theta), r * np.sin(theta), z])
+    if rng is None:
+        rng = _rng
+    return _crown_points(_shape_code(shape), float(height), float(radius), n, rng)
 
-    else:
-        raise ValueError("Unsupported crown shape")
+
+def sample_point_in_crown(
+    shape: str,
+    height: float,
+    radius: float,
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
+    """
+    Sample a single random point inside a tree crown volume.
+
+    Convenience wrapper around `sample_points_in_crown` for one point.
+
+    Parameters
+    ----------
+    shape : str
+        Shape of the crown: "sphere", "sphere_w_LH", "cylinder" or "cone".
+    height : float
+        Vertical extent of the crown along the z-axis.
+    radius : float
+        Maximum horizontal radius of the crown in the xy-plane.
+    rng : np.random.Generator, optional
+        Random generator to draw from. Defaults to the shared module-level
+        generator.
+
+    Returns
+    -------
+    np.ndarray
+        A 3-element array [x, y, z] representing the coordinates of a point
+        randomly sampled inside the crown volume.
+
+    Raises
+    ------
+    ValueError
+        If an unsupported crown shape is provided.
+    """
+    return sample_points_in_crown(shape, height, radius, 1, rng)[0]
+
+
+def _leaf_count(lai, crown_radius, mean_leaf_radius):
+    # Number of leaves from LAI; the pi in both disk areas cancels
+    return int(lai * (crown_radius / mean_leaf_radius) ** 2)
 
 
 def generate_tree(
@@ -145,6 +495,7 @@ def generate_tree(
     leaf_radius_params: dict,
     leaf_angle_distribution: str,
     position: List[float],
+    rng: Optional[np.random.Generator] = None,
 ) -> Dict:
     """
     Generate a single 3D tree model with trunk and leaves.
@@ -181,19 +532,22 @@ def generate_tree(
         "uniform", "spherical", "planophile", "erectophile".
     position : List[float]
         [x, y, z] coordinates of the tree base in world space.
+    rng : np.random.Generator, optional
+        Random generator to draw from. Defaults to a shared module-level
+        generator; pass a dedicated one for reproducible or parallel runs.
 
     Returns
     -------
     Dict
         A dictionary representing the tree with keys:
         - "trunk": dictionary with keys
-            - "base": 3-element array of the trunk base position [x, y, z].
+            - "base": tuple (x, y, z) of the trunk base position.
             - "height": trunk height.
             - "radius": trunk radius.
-        - "leaves": list of dictionaries, each with keys
-            - "center": 3-element array of leaf position [x, y, z].
-            - "radius": leaf radius.
-            - "normal": 3-element array representing leaf orientation.
+        - "leaves": dictionary of float32 per-leaf arrays (one row per leaf) with keys
+            - "centers": (n_leaves, 3) array of leaf positions [x, y, z].
+            - "normals": (n_leaves, 3) array of leaf orientations.
+            - "radii": (n_leaves,) array of leaf radii.
 
     Notes
     -----
@@ -203,46 +557,199 @@ def generate_tree(
     - Leaf normals are sampled according to `leaf_angle_distribution`.
     - Crown base is positioned at the top of the trunk.
     - Number of leaves is computed from LAI and crown/leaf areas.
+    - Leaves are stored as arrays rather than one dictionary per leaf, so
+      downstream code can process a whole tree with bulk NumPy operations.
+      Single precision is used to halve memory and the data shipped to
+      plotting and export; it is ample for leaf geometry.
     - All positions are returned in world coordinates relative to the tree base.
     """
+    if rng is None:
+        rng = _rng
+
     # Trunk
-    trunk = {"base": np.array(position), "height": trunk_height, "radius": trunk_radius}
+    x0, y0, z0 = (float(c) for c in position)
+    trunk = {"base": (x0, y0, z0), "height": trunk_height, "radius": trunk_radius}
 
     # Crown base position
-    crown_base_z = position[2] + trunk_height
+    crown_base_z = z0 + trunk_height
 
     mean_leaf_radius = leaf_radius_params["mean"]
 
-    # Compute number of leaves from LAI
-    crown_area = np.pi * crown_radius**2
-    leaf_area = np.pi * mean_leaf_radius**2
-    n_leaves = int((lai * crown_area) / leaf_area)
-
-    leaves = []
-
-    for _ in range(n_leaves):
-        local_pos = sample_point_in_crown(crown_shape, crown_height, crown_radius)
-        world_pos = np.array(
-            [
-                position[0] + local_pos[0],
-                position[1] + local_pos[1],
-                crown_base_z + local_pos[2],
-            ]
+    shape_code = _shape_code(crown_shape)
+    distribution_code = _distribution_code(leaf_angle_distribution)
+
+    n_leaves = _leaf_count(lai, crown_radius, mean_leaf_radius)
+
+    # Leafless crown: skip the samplers and the random stream entirely
+    if n_leaves <= 0:
+        leaves = {
+            "centers": np.empty((0, 3), dtype=np.float32),
+            "normals": np.empty((0, 3), dtype=np.float32),
+            "radii": np.empty(0, dtype=np.float32),
+        }
+        return {"trunk": trunk, "leaves": leaves}
+
+    # Sample all leaf positions (already in world space) and normals at once
+    centers, normals = _gen_leaves(
+        shape_code,
+        n_leaves,
+        float(crown_height),
+        float(crown_radius),
+        x0,
+        y0,
+        float(crown_base_z),
+        distribution_code,
+        rng,
+    )
+
+    radii = rng.standard_normal(n_leaves, dtype=np.float32)
+    radii *= leaf_radius_params["sd"]
+    radii += mean_leaf_radius
+    np.clip(radii, leaf_radius_params["min"], leaf_radius_params["max"], out=radii)
+
+    leaves = {"centers": centers, "normals": normals, "radii": radii}
+
+    return {"trunk": trunk, "leaves": leaves}
+
+
+def _generate_tree_worker(params, seed_seq):
+    """Generate one tree with its own random stream (runs in worker processes)."""
+    return generate_tree(rng=np.random.default_rng(seed_seq), **params)
+
+
+def generate_trees(
+    params_list: List[Dict],
+    n_jobs: int = 1,
+    seed: Union[int, np.random.SeedSequence, None] = None,
+) -> List[Dict]:
+    """
+    Generate several independent trees, optionally in parallel.
+
+    Trees do not depend on each other, so they can be spread across worker
+    processes. Each tree draws from its own random stream spawned from a
+    single `np.random.SeedSequence`, so the result is reproducible for a
+    given seed and does not depend on `n_jobs` or on whether numba is
+    installed. The "cupy" backend samples leaves from a device generator, so
+    its trees differ from the CPU backends' for the same seed.
+
+    Parameters
+    ----------
+    params_list : List[Dict]
+        One dictionary of `generate_tree` keyword arguments per tree,
+        including "position".
+    n_jobs : int, optional
+        Number of worker processes. 1 (default) runs serially; -1 uses all
+        CPU cores. Ignored (serial) while the "cupy" or "numba_parallel"
+        backend is selected.
+    seed : int or np.random.SeedSequence, optional
+        Seed for the per-tree random streams. None (default) draws fresh
+        entropy from the operating system.
+
+    Returns
+    -------
+    List[Dict]
+        Trees in the same order as `params_list`, as returned by
+        `generate_tree`.
+
+    Raises
+    ------
+    ValueError
+        If `n_jobs` is not a positive integer or -1.
+    """
+    validate_n_jobs(n_jobs)
+    return list(_iter_trees(params_list, n_jobs, seed))
+
+
+def _iter_trees(params_list, n_jobs, seed):
+    """Yield the trees of `generate_trees` one at a time, in order."""
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    seed_seqs = seed.spawn(len(params_list))
+
+    # Forked workers cannot use a CUDA context initialized in the parent, and
+    # the parallel leaf kernels already keep every core busy
+    if n_jobs == 1 or len(params_list) <= 1 or _xp is not np or _parallel_leaves:
+        yield from map(_generate_tree_worker, params_list, seed_seqs)
+        return
+
+    max_workers = (os.cpu_count() or 1) if n_jobs == -1 else n_jobs
+    chunksize = max(1, len(params_list) // (4 * max_workers))
+    # Forking a process whose numba thread pool is running can hang, so
+    # workers start from a fresh interpreter once that may be the case
+    mp_context = None
+    if _leaf_threads_started:
+        mp_context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers, mp_context) as executor:
+        yield from executor.map(
+            _generate_tree_worker, params_list, seed_seqs, chunksize=chunksize
         )
 
-        mean = mean_leaf_radius
-        sd = leaf_radius_params["sd"]
-        min_r = leaf_radius_params["min"]
-        max_r = leaf_radius_params["max"]
 
-        leaf_radius = np.random.normal(mean, sd)
-        leaf_radius = np.clip(leaf_radius, min_r, max_r)
+def _leaf_arrays(leaves):
+    """
+    A tree's leaf centers, normals and radii as float32 arrays.
+
+    Also accepts plain lists (e.g. a stand reloaded from JSON), which are
+    coerced to arrays of shape (n, 3), (n, 3) and (n,).
+    """
+    centers = np.asarray(leaves["centers"], dtype=np.float32).reshape(-1, 3)
+    normals = np.asarray(leaves["normals"], dtype=np.float32).reshape(-1, 3)
+    radii = np.asarray(leaves["radii"], dtype=np.float32).reshape(-1)
+    return centers, normals, radii
+
+
+class LeafView:
+    """
+    Per-leaf, read-only view over a tree's leaf arrays.
+
+    `generate_tree` stores leaves as arrays (`centers`, `normals`, `radii`).
+    This wrapper restores the one-dictionary-per-leaf interface for code that
+    iterates leaves individually, without copying the underlying arrays.
+    The "center" and "normal" rows are read-only; copy them before modifying.
+
+    Parameters
+    ----------
+    leaves : dict
+        The "leaves" entry of a tree returned by `generate_tree`.
 
-        leaf = {
-            "center": world_pos,
-            "radius": leaf_radius,
-            "normal": sample_leaf_normal(leaf_angle_distribution),
+    Examples
+    --------
+    >>> for leaf in LeafView(tree["leaves"]):
+    ...     leaf["center"], leaf["normal"], leaf["radius"]
+    """
+
+    def __init__(self, leaves: dict):
+        # Write-protected views: rows handed out cannot modify the tree
+        self.centers = leaves["centers"].view()
+        self.normals = leaves["normals"].view()
+        self.radii = leaves["radii"].view()
+        for array in (self.centers, self.normals, self.radii):
+            array.setflags(write=False)
+
+    def __len__(self) -> int:
+        return len(self.radii)
+
+    def __getitem__(self, i: int) -> dict:
+        return {
+            "center": self.centers[i],
+            "normal": self.normals[i],
+            "radius": self.radii[i],
         }
-        leaves.append(leaf)
 
-    return {"trunk": trunk, "leaves": leaves}
+    def __iter__(self):
+        for center, normal, radius in zip(self.centers, self.normals, self.radii):
+            yield {"center": center, "normal": normal, "radius": radius}
+
+    def to_list(self) -> list:
+        """
+        Convert all leaves to plain Python per-leaf dictionaries.
+
+        The arrays are converted with `tolist()` in one pass each, so
+        "center" and "normal" are lists of floats and "radius" is a float.
+        """
+        return [
+            {"center": center, "normal": normal, "radius": radius}
+            for center, normal, radius in zip(
+                self.centers.tolist(), self.normals.tolist(), self.radii.tolist()
+            )
+        ]
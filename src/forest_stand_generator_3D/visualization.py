@@ -1,6 +1,58 @@
 import numpy as np
 import plotly.graph_objects as go
+from functools import lru_cache
 from .data_validation import validate_plot
+from .tree import _leaf_arrays
+
+# Mesh topology depends only on the resolution, so it is built once per
+# resolution and reused (read-only) for every trunk and leaf.
+
+
+@lru_cache(maxsize=None)
+def _unit_circle(resolution):
+    """Cosines and sines of `resolution` evenly spaced angles (float32)."""
+    theta = np.linspace(0, 2 * np.pi, resolution, endpoint=False, dtype=np.float32)
+    cos_t, sin_t = np.cos(theta), np.sin(theta)
+    cos_t.setflags(write=False)
+    sin_t.setflags(write=False)
+    return cos_t, sin_t
+
+
+@lru_cache(maxsize=None)
+def _cylinder_faces(resolution):
+    """Triangle indices (i, j, k) of a capped cylinder with 2 * resolution + 2 vertices."""
+    t = np.arange(resolution, dtype=np.int32)
+    t_next = (t + 1) % resolution
+    center_bottom = np.full(resolution, 2 * resolution, dtype=np.int32)
+    center_top = np.full(resolution, 2 * resolution + 1, dtype=np.int32)
+
+    # side faces, bottom cap, top cap
+    i = np.concatenate([t, t, center_bottom, center_top])
+    j = np.concatenate([t_next, t_next + resolution, t, t + resolution])
+    k = np.concatenate(
+        [t_next + resolution, t + resolution, t_next, t_next + resolution]
+    )
+    for a in (i, j, k):
+        a.setflags(write=False)
+    return i, j, k
+
+
+@lru_cache(maxsize=None)
+def _disk_faces(resolution):
+    """Triangle fan indices (i, j, k) of a disk: vertex 0 is the center, 1..resolution the rim."""
+    fan = np.arange(1, resolution + 1, dtype=np.int32)
+    i = np.zeros(resolution, dtype=np.int32)
+    j = fan
+    k = np.roll(fan, -1)
+    for a in (i, j, k):
+        a.setflags(write=False)
+    return i, j, k
+
+
+def _instance_faces(faces, n_instances, n_vertices):
+    """Repeat a face pattern for `n_instances` meshes of `n_vertices` each."""
+    offsets = np.arange(n_instances, dtype=np.int32) * n_vertices
+    return tuple(np.add.outer(offsets, f).ravel() for f in faces)
 
 
 def plot_forest_stand(stand, plot_width, plot_length, resolution=20):
@@ -17,119 +69,120 @@ def plot_forest_stand(stand, plot_width, plot_length, resolution=20):
 
     fig = go.Figure()
 
-    # Cylinder for trunk (solid)
-    def create_cylinder_mesh(x, y, z_base, height, radius, resolution=20):
-        theta = np.linspace(0, 2 * np.pi, resolution, endpoint=False)
-        circle_x = radius * np.cos(theta) + x
-        circle_y = radius * np.sin(theta) + y
-        z_bottom = np.full(resolution, z_base)
-        z_top = np.full(resolution, z_base + height)
-
-        # Combine bottom and top vertices + centers
-        vertices_x = np.concatenate([circle_x, circle_x, [x, x]])
-        vertices_y = np.concatenate([circle_y, circle_y, [y, y]])
-        vertices_z = np.concatenate([z_bottom, z_top, [z_base, z_base + height]])
-
-        i, j, k = [], [], []
-
-        # side faces
-        for t in range(resolution):
-            b0 = t
-            b1 = (t + 1) % resolution
-            t0 = t + resolution
-            t1 = (t + 1) % resolution + resolution
-            i.append(b0)
-            j.append(b1)
-            k.append(t1)
-            i.append(b0)
-            j.append(t1)
-            k.append(t0)
-
-        # bottom cap
-        center_bottom = 2 * resolution
-        for t in range(resolution):
-            i.append(center_bottom)
-            j.append(t)
-            k.append((t + 1) % resolution)
-
-        # top cap
-        center_top = 2 * resolution + 1
-        for t in range(resolution):
-            i.append(center_top)
-            j.append(t + resolution)
-            k.append((t + 1) % resolution + resolution)
-
-        return vertices_x, vertices_y, vertices_z, i, j, k
-
-    # Disk for leaf (filled)
-    def create_filled_leaf(center, radius, normal, resolution=20):
+    # Cylinders for all trunks (solid), merged into a single mesh
+    def create_trunk_meshes(bases, heights, radii, resolution=20):
         """
-        Returns x, y, z, i, j, k for a filled disk oriented by normal
+        Returns x, y, z, i, j, k for one mesh holding every trunk cylinder
         """
-        # circle in XY plane
-        theta = np.linspace(0, 2 * np.pi, resolution, endpoint=False)
-        circle = np.stack(
-            [radius * np.cos(theta), radius * np.sin(theta), np.zeros_like(theta)],
-            axis=1,
+        n_trunks = len(radii)
+        cos_t, sin_t = _unit_circle(resolution)
+
+        x0, y0, z0 = bases[:, 0:1], bases[:, 1:2], bases[:, 2:3]
+        z1 = z0 + heights[:, None]
+        circle_x = radii[:, None] * cos_t + x0
+        circle_y = radii[:, None] * sin_t + y0
+
+        # per trunk: bottom ring, top ring, bottom center, top center
+        vertices = np.empty((n_trunks, 2 * resolution + 2, 3), dtype=np.float32)
+        vertices[:, :resolution, 0] = circle_x
+        vertices[:, resolution : 2 * resolution, 0] = circle_x
+        vertices[:, 2 * resolution :, 0] = x0
+        vertices[:, :resolution, 1] = circle_y
+        vertices[:, resolution : 2 * resolution, 1] = circle_y
+        vertices[:, 2 * resolution :, 1] = y0
+        vertices[:, :resolution, 2] = z0
+        vertices[:, resolution : 2 * resolution, 2] = z1
+        vertices[:, 2 * resolution, 2] = z0[:, 0]
+        vertices[:, 2 * resolution + 1, 2] = z1[:, 0]
+        vertices = vertices.reshape(-1, 3)
+
+        # repeat the cylinder topology for every trunk
+        i, j, k = _instance_faces(
+            _cylinder_faces(resolution), n_trunks, 2 * resolution + 2
         )
 
-        # rotation to align z-axis to normal
-        normal = np.array(normal) / np.linalg.norm(normal)
-        z_axis = np.array([0, 0, 1])
-        if np.allclose(normal, z_axis):
-            R = np.eye(3)
-        elif np.allclose(normal, -z_axis):
-            R = np.diag([1, 1, -1])
-        else:
-            v = np.cross(z_axis, normal)
-            s = np.linalg.norm(v)
-            c = np.dot(z_axis, normal)
-            vx = np.array([[0, -v[2], v[1]], [v[2], 0, -v[0]], [-v[1], v[0], 0]])
-            R = np.eye(3) + vx + vx @ vx * ((1 - c) / (s**2))
-
-        # rotate and translate
-        circle = (R @ circle.T).T + np.array(center)
-        center_point = np.array(center)
-
-        # vertices
-        X = np.vstack([center_point, circle])[:, 0]
-        Y = np.vstack([center_point, circle])[:, 1]
-        Z = np.vstack([center_point, circle])[:, 2]
-
-        # triangle fan
-        i, j, k = [], [], []
-        for t in range(1, resolution):
-            i.append(0)
-            j.append(t)
-            k.append(t + 1)
-        # close the fan
-        i.append(0)
-        j.append(resolution)
-        k.append(1)
+        return vertices[:, 0], vertices[:, 1], vertices[:, 2], i, j, k
+
+    # Disks for all leaves of one tree (filled), merged into a single mesh
+    def create_leaf_disks(centers, radii, normals, resolution=20):
+        """
+        Returns x, y, z, i, j, k for filled disks oriented by their normals
+        """
+        n_leaves = len(radii)
+        cos_t, sin_t = _unit_circle(resolution)
+        px = radii[:, None] * cos_t
+        py = radii[:, None] * sin_t
+
+        # A disk looks the same from both sides, so flip normals into the
+        # upper hemisphere; this keeps the rotation below well defined.
+        n = normals / np.sqrt(np.einsum("ij,ij->i", normals, normals))[:, None]
+        n = np.where(n[:, 2:3] < 0, -n, n)
+        nx, ny, nz = n[:, 0:1], n[:, 1:2], n[:, 2:3]
+        k_rot = 1 / (1 + nz)
+
+        # Rodrigues rotation of the xy-plane circle so that z aligns with the normal
+        rim_x = centers[:, 0:1] + px * (1 - k_rot * nx * nx) - py * k_rot * nx * ny
+        rim_y = centers[:, 1:2] - px * k_rot * nx * ny + py * (1 - k_rot * ny * ny)
+        rim_z = centers[:, 2:3] - px * nx - py * ny
+
+        # vertices: center followed by the rim, per leaf
+        X = np.hstack([centers[:, 0:1], rim_x]).ravel()
+        Y = np.hstack([centers[:, 1:2], rim_y]).ravel()
+        Z = np.hstack([centers[:, 2:3], rim_z]).ravel()
+
+        # triangle fan, repeated for every leaf
+        i, j, k = _instance_faces(_disk_faces(resolution), n_leaves, resolution + 1)
 
         return X, Y, Z, i, j, k
 
-    # Plot trunks
-    for tree_idx, tree in enumerate(stand, start=1):
-        trunk = tree["trunk"]
-        x0, y0, z0 = trunk["base"]
-        h = trunk["height"]
-        r = trunk["radius"]
+    # Plot trunks (one mesh for the whole stand)
+    if stand:
+        bases = np.array([tree["trunk"]["base"] for tree in stand], dtype=np.float32)
+        heights = np.array(
+            [tree["trunk"]["height"] for tree in stand], dtype=np.float32
+        )
+        radii = np.array([tree["trunk"]["radius"] for tree in stand], dtype=np.float32)
 
-        X, Y, Z, i, j, k = create_cylinder_mesh(x0, y0, z0, h, r, resolution)
+        X, Y, Z, i, j, k = create_trunk_meshes(bases, heights, radii, resolution)
         fig.add_trace(
-            go.Mesh3d(x=X, y=Y, z=Z, i=i, j=j, k=k, color="saddlebrown", opacity=1.0, name=f"Trunk {tree_idx}", legendgroup=f"Tree {tree_idx}", showlegend=True)
+            go.Mesh3d(
+                x=X,
+                y=Y,
+                z=Z,
+                i=i,
+                j=j,
+                k=k,
+                color="saddlebrown",
+                opacity=1.0,
+                name="Trunks",
+                legendgroup="Trunks",
+                showlegend=True,
+            )
         )
 
-    # Plot leaves
+    # Plot leaves (one mesh per tree)
     for tree_idx, tree in enumerate(stand, start=1):
-        for leaf_idx, leaf in enumerate(tree["leaves"], start=1):
-            X, Y, Z, i, j, k = create_filled_leaf(
-                leaf["center"], leaf["radius"], leaf["normal"], resolution
-            )
-            fig.add_trace(
-                go.Mesh3d(x=X, y=Y, z=Z, i=i, j=j, k=k, color="green", opacity=0.7, name=f"Tree {tree_idx} – Leaf {leaf_idx}", legendgroup=f"Tree {tree_idx}", showlegend=(leaf_idx==1))
+        # accept plain lists too (e.g. a stand reloaded from JSON)
+        centers, normals, radii = _leaf_arrays(tree["leaves"])
+        if len(radii) == 0:
+            continue
+
+        X, Y, Z, i, j, k = create_leaf_disks(centers, radii, normals, resolution)
+        fig.add_trace(
+            go.Mesh3d(
+                x=X,
+                y=Y,
+                z=Z,
+                i=i,
+                j=j,
+                k=k,
+                color="green",
+                opacity=0.7,
+                name=f"Tree {tree_idx} – Leaves",
+                legendgroup=f"Tree {tree_idx}",
+                showlegend=True,
             )
+        )
 
     fig.update_layout(
         title=f"3D Forest Stand (Plot {plot_length} x {plot_width})",
@@ -141,7 +194,7 @@ def plot_forest_stand(stand, plot_width, plot_length, resolution=20):
             yaxis=dict(range=[0, plot_width]),
             aspectmode="manual",
             aspectratio=dict(x=plot_length, y=plot_width, z=plot_length),
-        )
+        ),
     )
 
     fig.show()
@@ -160,72 +213,77 @@ def plot_forest_top_view(stand, plot_width, plot_length):
 
     fig = go.Figure()
 
-    # Plot trunk footprints (circles)
-    for i, tree in enumerate(stand, start=1):
-        trunk = tree["trunk"]
-        x0, y0, _ = trunk["base"]
-        r = trunk["radius"]
+    # Plot trunk footprints (circles) as one trace, separated by NaN
+    if stand:
+        bases = np.array([tree["trunk"]["base"] for tree in stand], dtype=np.float32)
+        radii = np.array([tree["trunk"]["radius"] for tree in stand], dtype=np.float32)
 
-        theta = np.linspace(0, 2 * np.pi, 50)
-        x = x0 + r * np.cos(theta)
-        y = y0 + r * np.sin(theta)
+        theta = np.linspace(0, 2 * np.pi, 50, dtype=np.float32)
+        gap = np.full((len(stand), 1), np.nan, dtype=np.float32)
+        x = np.hstack([bases[:, 0:1] + radii[:, None] * np.cos(theta), gap]).ravel()
+        y = np.hstack([bases[:, 1:2] + radii[:, None] * np.sin(theta), gap]).ravel()
 
         fig.add_trace(
-            go.Scatter(
+            go.Scattergl(
                 x=x,
                 y=y,
                 fill="toself",
                 mode="lines",
                 line=dict(color="saddlebrown"),
                 fillcolor="saddlebrown",
-                name=f"Tree {i} – Trunk",
-                legendgroup=f"tree_{i}",
+                name="Trunks",
+                legendgroup="trunks",
             )
         )
 
-    # Plot leaf projections (ellipses)
+    # Plot leaf projections (ellipses), one WebGL trace per tree
+    t = np.linspace(0, 2 * np.pi, 40, dtype=np.float32)
+    ct, st = np.cos(t), np.sin(t)
+
     for i, tree in enumerate(stand, start=1):
-        for j, leaf in enumerate(tree["leaves"], start=1):
-            x0, y0, _ = leaf["center"]
-            r = leaf["radius"]
-
-            # normalize normal vector
-            n = np.array(leaf["normal"], dtype=float)
-            n /= np.linalg.norm(n)
-
-            # z-aligned leaves → circle
-            nz = abs(n[2])
-            if nz < 1e-4:
-                continue  # edge-on leaf, no visible area
-
-            # ellipse axes
-            a = r  # major axis
-            b = r * nz  # minor axis
-
-            # orientation of ellipse
-            angle = np.arctan2(n[1], n[0])
-
-            t = np.linspace(0, 2 * np.pi, 40)
-            ct, st = np.cos(t), np.sin(t)
-
-            # rotated ellipse
-            x = x0 + a * ct * np.cos(angle) - b * st * np.sin(angle)
-            y = y0 + a * ct * np.sin(angle) + b * st * np.cos(angle)
-
-            fig.add_trace(
-                go.Scatter(
-                    x=x,
-                    y=y,
-                    fill="toself",
-                    mode="lines",
-                    line=dict(color="green"),
-                    fillcolor="green",
-                    opacity=0.5,
-                    name=f"Tree {i} - Leaf {j}",
-                    legendgroup=f"tree_{i}_leaves",
-                    showlegend=(j == 1),
-                )
+        centers, normals, radii = _leaf_arrays(tree["leaves"])
+
+        # normalize normal vectors
+        n = normals / np.sqrt(np.einsum("ij,ij->i", normals, normals))[:, None]
+
+        # z-aligned leaves → circle; edge-on leaves have no visible area
+        nz = np.abs(n[:, 2])
+        visible = nz >= 1e-4
+        if not np.any(visible):
+            continue
+
+        x0 = centers[visible, 0:1]
+        y0 = centers[visible, 1:2]
+        r = radii[visible, None]
+
+        # ellipse axes
+        a = r  # major axis
+        b = r * nz[visible, None]  # minor axis
+
+        # orientation of ellipse
+        angle = np.arctan2(n[visible, 1:2], n[visible, 0:1])
+        cos_a, sin_a = np.cos(angle), np.sin(angle)
+
+        # rotated ellipses, separated by NaN so each one is filled on its own
+        x = x0 + a * ct * cos_a - b * st * sin_a
+        y = y0 + a * ct * sin_a + b * st * cos_a
+        gap = np.full((len(x), 1), np.nan, dtype=x.dtype)
+        x = np.hstack([x, gap]).ravel()
+        y = np.hstack([y, gap]).ravel()
+
+        fig.add_trace(
+            go.Scattergl(
+                x=x,
+                y=y,
+                fill="toself",
+                mode="lines",
+                line=dict(color="green"),
+                fillcolor="green",
+                opacity=0.5,
+                name=f"Tree {i} - Leaves",
+                legendgroup=f"tree_{i}_leaves",
             )
+        )
 
     # Layout
     fig.update_layout(
@@ -255,3 +313,65 @@ def plot_forest_top_view(stand, plot_width, plot_length):
     )
 
     fig.show()
+
+
+def plot_forest_stand_piviz(stand, leaf_detail=6, trunk_detail=16):
+    """
+    Render a 3D forest stand on the GPU with piviz-3d (ModernGL)
+
+    Trunks and leaves are pushed as instance buffers, so each primitive type
+    is drawn with a single instanced call. This stays interactive for stands
+    with hundreds of thousands of leaves, where Plotly stalls.
+
+    Args:
+        stand: List of tree dictionaries
+        leaf_detail: Tessellation level of the leaf spheres
+        trunk_detail: Tessellation level of the trunk cylinders
+
+    Notes:
+        Requires the optional `piviz-3d` package and an OpenGL 3.3 capable
+        display. Leaves are drawn as spheres of the leaf radius; their
+        normals are not used yet.
+    """
+    try:
+        from piviz import PiVizFX, PiVizStudio, pgfx
+    except ImportError:
+        raise ImportError(
+            "plot_forest_stand_piviz requires piviz-3d (pip install piviz-3d)"
+        ) from None
+
+    # Trunk instances: one cylinder per tree from base to top
+    trunk_starts = np.array(
+        [tree["trunk"]["base"] for tree in stand], dtype=np.float32
+    ).reshape(-1, 3)
+    trunk_ends = trunk_starts.copy()
+    trunk_ends[:, 2] += [tree["trunk"]["height"] for tree in stand]
+    trunk_radii = np.array(
+        [tree["trunk"]["radius"] for tree in stand], dtype=np.float32
+    )
+    trunk_colors = np.tile(
+        np.array([0.545, 0.271, 0.075], dtype=np.float32), (len(stand), 1)
+    )
+
+    # Leaf instances: all leaves of the stand in one buffer
+    leaves = [_leaf_arrays(tree["leaves"]) for tree in stand]
+    leaf_centers = np.concatenate(
+        [centers for centers, _, _ in leaves] + [np.empty((0, 3), np.float32)]
+    )
+    leaf_radii = np.concatenate(
+        [radii for _, _, radii in leaves] + [np.empty(0, np.float32)]
+    )
+    leaf_colors = np.tile(
+        np.array([0.0, 0.502, 0.0], dtype=np.float32), (len(leaf_radii), 1)
+    )
+
+    class ForestStandScene(PiVizFX):
+        def render(self, time, dt):
+            pgfx.draw_cylinders_batch(
+                trunk_starts, trunk_ends, trunk_radii, trunk_colors, detail=trunk_detail
+            )
+            pgfx.draw_spheres_batch(
+                leaf_centers, leaf_radii, leaf_colors, detail=leaf_detail
+            )
+
+    PiVizStudio(scene_fx=ForestStandScene()).run()
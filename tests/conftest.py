@@ -0,0 +1,29 @@
+# tests/conftest.py
+
+# ==============================================================
+# IMPORTS
+# ==============================================================
+
+import numpy as np
+import pytest
+from forest_stand_generator_3D.tree import generate_tree
+
+
+@pytest.fixture
+def stand():
+    """Two leafy trees around a tree with zero leaves, inside a 10 x 10 plot."""
+    params = {
+        "trunk_height": 5.0,
+        "trunk_radius": 0.2,
+        "crown_shape": "sphere",
+        "crown_height": 4.0,
+        "crown_radius": 1.0,
+        "leaf_radius_params": {"mean": 0.1, "sd": 0.01, "min": 0.05, "max": 0.15},
+        "leaf_angle_distribution": "uniform",
+    }
+    rng = np.random.default_rng(0)
+    return [
+        generate_tree(lai=1.0, position=[2.0, 2.0, 0.0], rng=rng, **params),
+        generate_tree(lai=0.0, position=[5.0, 2.0, 0.0], rng=rng, **params),
+        generate_tree(lai=0.5, position=[8.0, 2.0, 0.0], rng=rng, **params),
+    ]
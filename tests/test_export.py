@@ -0,0 +1,161 @@
+# tests/test_export.py
+
+# ==============================================================
+# IMPORTS
+# ==============================================================
+
+import csv
+import json
+import numpy as np
+import pytest
+from forest_stand_generator_3D import export
+from forest_stand_generator_3D.export import (
+    export_forest_stand_to_csv,
+    export_forest_stand_to_json,
+    export_forest_stand_to_npz,
+    export_forest_stand_to_parquet,
+)
+
+COLUMNS = ["tree_id", "type", "x", "y", "z", "radius", "nx", "ny", "nz"]
+
+
+def read_csv_rows(filename):
+    with open(filename, newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        return header, list(reader)
+
+
+def reload_via_json(stand, filename):
+    """The stand as plain lists, the way json.load hands it back."""
+    export_forest_stand_to_json(stand, filename)
+    with open(filename) as f:
+        return json.load(f)
+
+
+def check_columns_match_csv(columns, header, rows):
+    assert list(columns) == header
+    assert len(columns["tree_id"]) == len(rows)
+    np.testing.assert_array_equal(columns["tree_id"], [int(r[0]) for r in rows])
+    np.testing.assert_array_equal(columns["type"], [r[1] for r in rows])
+    for idx, name in enumerate(COLUMNS[2:], start=2):
+        np.testing.assert_allclose(
+            columns[name], [float(r[idx]) for r in rows], rtol=1e-5, atol=1e-6
+        )
+
+
+def check_json_matches_stand(loaded, stand):
+    """Trunks come back exactly, leaves within float32 precision."""
+    assert len(loaded) == len(stand)
+    for tree_json, tree in zip(loaded, stand):
+        assert tree_json["trunk"] == {
+            **tree["trunk"],
+            "base": list(tree["trunk"]["base"]),
+        }
+        assert sorted(tree_json["leaves"]) == sorted(tree["leaves"])
+        for key, values in tree["leaves"].items():
+            loaded_values = np.array(tree_json["leaves"][key], dtype=np.float64)
+            np.testing.assert_allclose(
+                loaded_values.reshape(values.shape), values, rtol=1e-7, atol=0
+            )
+
+
+# ==============================================================
+# EXPORT TESTS
+# ==============================================================
+
+
+def test_json_orjson_and_stdlib_paths_agree(tmp_path, monkeypatch, stand):
+    """The orjson and json.dump writers load back to the same stand."""
+    pytest.importorskip("orjson")
+    export_forest_stand_to_json(stand, tmp_path / "orjson.json")
+    monkeypatch.setattr(export, "orjson", None)
+    export_forest_stand_to_json(stand, tmp_path / "stdlib.json")
+
+    with open(tmp_path / "orjson.json") as f:
+        fast = json.load(f)
+    with open(tmp_path / "stdlib.json") as f:
+        slow = json.load(f)
+
+    check_json_matches_stand(fast, stand)
+    check_json_matches_stand(slow, stand)
+
+
+def test_npz_round_trip_matches_csv(tmp_path, stand):
+    """NPZ columns hold the CSV rows in the same order, with compact dtypes."""
+    export_forest_stand_to_csv(stand, tmp_path / "stand.csv")
+    export_forest_stand_to_npz(stand, tmp_path / "stand.npz")
+
+    header, rows = read_csv_rows(tmp_path / "stand.csv")
+    with np.load(tmp_path / "stand.npz") as data:
+        columns = {name: data[name] for name in data.files}
+
+    check_columns_match_csv(columns, header, rows)
+
+    # The leafless tree contributes exactly its trunk row
+    assert np.sum(columns["tree_id"] == 1) == 1
+    assert columns["type"][columns["tree_id"] == 1][0] == "trunk"
+
+    assert columns["tree_id"].dtype == np.int32
+    assert columns["type"].dtype.kind == "U"
+    for name in COLUMNS[2:]:
+        assert columns[name].dtype == np.float32
+
+
+def test_npz_accepts_json_reloaded_stand(tmp_path, stand):
+    """A reloaded stand (plain lists, a leafless tree) gives the same columns."""
+    reloaded = reload_via_json(stand, tmp_path / "stand.json")
+    export_forest_stand_to_npz(stand, tmp_path / "stand.npz")
+    export_forest_stand_to_npz(reloaded, tmp_path / "reloaded.npz")
+
+    with np.load(tmp_path / "stand.npz") as a, np.load(tmp_path / "reloaded.npz") as b:
+        assert a.files == b.files
+        for name in a.files:
+            np.testing.assert_array_equal(a[name], b[name])
+
+
+def test_parquet_round_trip_matches_csv(tmp_path, stand):
+    """Parquet columns hold the CSV rows in the same order, with compact dtypes."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    export_forest_stand_to_csv(stand, tmp_path / "stand.csv")
+    export_forest_stand_to_parquet(stand, tmp_path / "stand.parquet")
+
+    header, rows = read_csv_rows(tmp_path / "stand.csv")
+    table = pq.read_table(tmp_path / "stand.parquet")
+    columns = {name: table.column(name).to_numpy() for name in table.column_names}
+
+    check_columns_match_csv(columns, header, rows)
+    assert np.sum(columns["tree_id"] == 1) == 1
+
+    assert columns["tree_id"].dtype == np.int32
+    assert str(table.schema.field("type").type) == "string"
+    for name in COLUMNS[2:]:
+        assert columns[name].dtype == np.float32
+
+
+def test_csv_values_round_trip_exactly(tmp_path, stand):
+    """Trunk values are written exactly and leaf values survive as float32."""
+    stand[0]["trunk"]["base"] = (1234.56789, 0.1, 0.0)
+    export_forest_stand_to_csv(stand, tmp_path / "stand.csv")
+
+    _, rows = read_csv_rows(tmp_path / "stand.csv")
+    assert [float(v) for v in rows[0][2:6]] == [1234.56789, 0.1, 0.0, 0.2]
+
+    leaves = stand[0]["leaves"]
+    leaf_rows = np.array(
+        [[float(v) for v in r[2:]] for r in rows if r[:2] == ["0", "leaf"]]
+    ).astype(np.float32)
+    np.testing.assert_array_equal(leaf_rows[:, :3], leaves["centers"])
+    np.testing.assert_array_equal(leaf_rows[:, 3], leaves["radii"])
+    np.testing.assert_array_equal(leaf_rows[:, 4:], leaves["normals"])
+
+
+def test_csv_accepts_json_reloaded_stand(tmp_path, stand):
+    """A reloaded stand (plain lists, a leafless tree) exports the same CSV."""
+    reloaded = reload_via_json(stand, tmp_path / "stand.json")
+    export_forest_stand_to_csv(stand, tmp_path / "stand.csv")
+    export_forest_stand_to_csv(reloaded, tmp_path / "reloaded.csv")
+
+    header, rows = read_csv_rows(tmp_path / "stand.csv")
+    assert read_csv_rows(tmp_path / "reloaded.csv") == (header, rows)
+    assert sum(r[0] == "1" for r in rows) == 1
@@ -6,7 +6,7 @@
 
 import numpy as np
 import pytest
-from forest_stand_generator_3D.stand import generate_stand
+from forest_stand_generator_3D.stand import generate_stand, generate_stand_arrays
 
 
 # SHARED TREE PARAMETERS
@@ -81,10 +81,33 @@ def test_random_placement_respects_min_spacing():
     positions = [tree["trunk"]["base"][:2] for tree in trees]
     for i in range(len(positions)):
         for j in range(i + 1, len(positions)):
-            dist = np.linalg.norm(positions[i] - positions[j])
+            dist = np.linalg.norm(np.subtract(positions[i], positions[j]))
             assert dist >= min_spacing
 
 
+def test_random_placement_respects_trunk_radii():
+    """Random placement keeps trunks apart when radii exceed min_spacing."""
+    min_spacing = 0.5
+    n_trees = 30
+    tree_params_list = [
+        {**default_tree_params, "trunk_radius": 0.2 + 0.4 * (i % 2)}
+        for i in range(n_trees)
+    ]
+    trees = generate_stand(
+        plot_width=12.0,
+        plot_length=12.0,
+        n_trees=n_trees,
+        placement="random",
+        min_spacing=min_spacing,
+        tree_params=tree_params_list,
+    )
+    for i in range(len(trees)):
+        for j in range(i + 1, len(trees)):
+            ti, tj = trees[i]["trunk"], trees[j]["trunk"]
+            dist = np.linalg.norm(np.subtract(ti["base"][:2], tj["base"][:2]))
+            assert dist >= max(min_spacing, ti["radius"] + tj["radius"])
+
+
 # ==============================================================
 # PER-TREE PARAMETERS TESTS
 # ==============================================================
@@ -108,6 +131,36 @@ def test_per_tree_parameters_are_applied_correctly():
     assert trees[1]["trunk"]["height"] == 6.0
 
 
+# ==============================================================
+# PARALLEL GENERATION TESTS
+# ==============================================================
+
+
+def test_parallel_generation_matches_placement():
+    """Trees generated in worker processes keep their positions and parameters."""
+    tree_params_list = [
+        {**default_tree_params, "trunk_height": 4.0 + i} for i in range(4)
+    ]
+    trees = generate_stand(
+        plot_width=10.0,
+        plot_length=10.0,
+        n_trees=4,
+        placement="uniform",
+        min_spacing=0.0,
+        tree_params=tree_params_list,
+        n_jobs=2,
+    )
+    assert len(trees) == 4
+    for i, tree in enumerate(trees):
+        assert tree["trunk"]["height"] == 4.0 + i
+        assert len(tree["leaves"]["centers"]) > 0
+    # independent random streams per tree
+    assert not np.allclose(
+        trees[0]["leaves"]["centers"][:, 2] - trees[0]["trunk"]["height"],
+        trees[1]["leaves"]["centers"][:, 2] - trees[1]["trunk"]["height"],
+    )
+
+
 # ==============================================================
 # ERROR HANDLING TESTS
 # ==============================================================
@@ -138,3 +191,61 @@ def test_invalid_placement_type_raises_error():
             min_spacing=0.0,
             tree_params=default_tree_params,
         )
+
+
+def test_invalid_n_jobs_raises_error():
+    """n_jobs must be a positive integer or -1."""
+    with pytest.raises(ValueError):
+        generate_stand(
+            plot_width=10.0,
+            plot_length=10.0,
+            n_trees=2,
+            placement="uniform",
+            min_spacing=0.0,
+            tree_params=default_tree_params,
+            n_jobs=0,
+        )
+
+
+def test_seed_reproduces_stand():
+    """The same seed yields identical stands, serially or in parallel."""
+    kwargs = dict(
+        plot_width=10.0,
+        plot_length=10.0,
+        n_trees=4,
+        placement="random",
+        min_spacing=1.0,
+        tree_params=default_tree_params,
+        seed=42,
+    )
+    stand_a = generate_stand(**kwargs)
+    stand_b = generate_stand(n_jobs=2, **kwargs)
+    assert len(stand_a) == len(stand_b)
+    for tree_a, tree_b in zip(stand_a, stand_b):
+        assert tree_a["trunk"]["base"] == tree_b["trunk"]["base"]
+        for key in ("centers", "normals", "radii"):
+            np.testing.assert_array_equal(tree_a["leaves"][key], tree_b["leaves"][key])
+
+
+def test_stand_arrays_match_stand():
+    """generate_stand_arrays packs the same stand into flat arrays."""
+    kwargs = dict(
+        plot_width=10.0,
+        plot_length=10.0,
+        n_trees=4,
+        placement="uniform",
+        min_spacing=0.0,
+        tree_params=default_tree_params,
+        seed=5,
+    )
+    stand = generate_stand(**kwargs)
+    trunks, leaves = generate_stand_arrays(**kwargs)
+    assert len(trunks) == len(stand)
+    for tid, tree in enumerate(stand):
+        np.testing.assert_array_equal(trunks["base"][tid], tree["trunk"]["base"])
+        assert trunks["radius"][tid] == np.float32(tree["trunk"]["radius"])
+        mask = leaves["tree_id"] == tid
+        np.testing.assert_array_equal(
+            leaves["centers"][mask], tree["leaves"]["centers"]
+        )
+        np.testing.assert_array_equal(leaves["radii"][mask], tree["leaves"]["radii"])
@@ -4,12 +4,20 @@
 # IMPORTS
 # ==============================================================
 
+import sys
+import types
 import numpy as np
 import pytest
+import forest_stand_generator_3D.tree as tree_module
 from forest_stand_generator_3D.tree import (
     sample_leaf_normal,
+    sample_leaf_normals,
     sample_point_in_crown,
+    sample_points_in_crown,
     generate_tree,
+    generate_trees,
+    LeafView,
+    set_backend,
 )
 
 # Shared leaf radius parameters for generate_tree tests
@@ -58,12 +66,33 @@ def test_erectophile_direction():
     np.testing.assert_array_equal(v, expected)
 
 
+def test_fixed_leaf_normals_are_shared_and_read_only():
+    """Fixed-direction normals reuse one write-protected array."""
+    v1 = sample_leaf_normal("planophile")
+    v2 = sample_leaf_normal("planophile")
+    assert v1 is v2
+    assert not v1.flags.writeable
+
+
 def test_unknown_distribution_raises_error():
     """Unsupported leaf distribution raises ValueError."""
     with pytest.raises(ValueError):
         sample_leaf_normal("unknown")
 
 
+def test_batch_uniform_returns_unit_vectors():
+    """Batched 'uniform' normals have shape (n, 3) and unit length."""
+    normals = sample_leaf_normals("uniform", 200)
+    assert normals.shape == (200, 3)
+    np.testing.assert_allclose(np.linalg.norm(normals, axis=1), 1.0, rtol=1e-6)
+
+
+def test_batch_planophile_direction():
+    """Batched 'planophile' normals all point up the z-axis."""
+    normals = sample_leaf_normals("planophile", 10)
+    np.testing.assert_array_equal(normals, np.tile([0.0, 0.0, 1.0], (10, 1)))
+
+
 # ==============================================================
 # SAMPLE_POINT_IN_CROWN TESTS
 # ==============================================================
@@ -125,6 +154,160 @@ def test_unknown_shape_raises_error():
         sample_point_in_crown("pyramid", height=5.0, radius=2.0)
 
 
+# ==============================================================
+# SAMPLE_POINTS_IN_CROWN TESTS
+# ==============================================================
+
+
+def test_batch_sphere_points_inside_volume():
+    """Batched sphere samples have the requested shape and lie in the ellipsoid."""
+    radius = 2.0
+    height = 6.0
+    points = sample_points_in_crown("sphere", height, radius, 500)
+    assert points.shape == (500, 3)
+    scaled = points.copy()
+    scaled[:, 2] *= radius / height
+    assert np.all(np.linalg.norm(scaled, axis=1) <= radius + 1e-9)
+
+
+def test_batch_sphere_w_lh_upper_hemisphere_only():
+    """Batched 'sphere_w_LH' samples all lie in the upper hemisphere."""
+    points = sample_points_in_crown("sphere_w_LH", 5.0, 2.0, 500)
+    assert points.shape == (500, 3)
+    assert np.all(points[:, 2] >= 0.0)
+    assert np.all(points[:, 2] <= 5.0)
+
+
+def test_batch_cone_points_inside_volume():
+    """Batched cone samples respect the tapering radius."""
+    radius = 3.0
+    height = 6.0
+    points = sample_points_in_crown("cone", height, radius, 500)
+    z = points[:, 2]
+    r_xy = np.linalg.norm(points[:, :2], axis=1)
+    assert np.all((0.0 <= z) & (z <= height))
+    assert np.all(r_xy <= radius * (1 - z / height) + 1e-12)
+
+
+def test_batch_cone_points_uniform_in_volume():
+    """Cone samples concentrate towards the base; the centroid sits at h/4."""
+    height = 8.0
+    points = sample_points_in_crown("cone", height, 2.0, 20000)
+    assert abs(points[:, 2].mean() - height / 4) < 0.02 * height
+
+
+def test_samplers_reproducible_with_seeded_rng():
+    """Passing generators with the same seed reproduces the samples."""
+    points_a = sample_points_in_crown("sphere", 4.0, 2.0, 50, np.random.default_rng(7))
+    points_b = sample_points_in_crown("sphere", 4.0, 2.0, 50, np.random.default_rng(7))
+    np.testing.assert_array_equal(points_a, points_b)
+    normals_a = sample_leaf_normals("uniform", 50, np.random.default_rng(7))
+    normals_b = sample_leaf_normals("uniform", 50, np.random.default_rng(7))
+    np.testing.assert_array_equal(normals_a, normals_b)
+
+
+def test_set_backend_unknown_raises_error():
+    """Unknown sampling backends raise ValueError."""
+    with pytest.raises(ValueError):
+        set_backend("opencl")
+
+
+def test_set_backend_cupy_missing_raises_import_error(monkeypatch):
+    """Without CuPy, selecting it raises ImportError and keeps NumPy."""
+    monkeypatch.setitem(sys.modules, "cupy", None)
+    with pytest.raises(ImportError):
+        set_backend("cupy")
+    assert tree_module._xp is np
+
+
+def test_set_backend_switches_back_to_numpy(monkeypatch):
+    """Switching to cupy and back to numpy restores the NumPy backend."""
+    fake_cupy = types.ModuleType("cupy")
+    monkeypatch.setitem(sys.modules, "cupy", fake_cupy)
+    monkeypatch.setattr(tree_module, "_xp", np)
+    set_backend("cupy")
+    assert tree_module._xp is fake_cupy
+    set_backend("numpy")
+    assert tree_module._xp is np
+
+
+def test_set_backend_numba_parallel_missing_raises_import_error(monkeypatch):
+    """Without numba, selecting the parallel kernels raises ImportError."""
+    monkeypatch.setattr(tree_module, "njit", None)
+    monkeypatch.setattr(tree_module, "_parallel_leaves", False)
+    with pytest.raises(ImportError):
+        set_backend("numba_parallel")
+    assert not tree_module._parallel_leaves
+
+
+@pytest.mark.parametrize("shape", ["sphere", "sphere_w_LH", "cylinder", "cone"])
+@pytest.mark.parametrize("distribution", ["uniform", "planophile"])
+def test_numba_parallel_backend_matches_numpy_samplers(
+    monkeypatch, shape, distribution
+):
+    """The parallel kernels draw the NumPy samplers' variates, in order."""
+    pytest.importorskip("numba")
+    params = dict(
+        trunk_height=5.0,
+        trunk_radius=0.2,
+        crown_shape=shape,
+        crown_height=4.0,
+        crown_radius=2.0,
+        lai=1.0,
+        leaf_radius_params=leaf_radius_params,
+        leaf_angle_distribution=distribution,
+        position=[1.0, 2.0, 0.0],
+    )
+    monkeypatch.setattr(tree_module, "_parallel_leaves", False)
+    monkeypatch.setattr(tree_module, "_leaf_threads_started", False)
+    set_backend("numba_parallel")
+    parallel = generate_tree(rng=np.random.default_rng(5), **params)["leaves"]
+    set_backend("numpy")
+
+    # Without njit the default CPU path is the vectorized NumPy samplers
+    monkeypatch.setattr(tree_module, "njit", None)
+    vectorized = generate_tree(rng=np.random.default_rng(5), **params)["leaves"]
+
+    for key in ("centers", "normals"):
+        assert parallel[key].dtype == np.float32
+        np.testing.assert_allclose(parallel[key], vectorized[key], atol=1e-5)
+    np.testing.assert_array_equal(parallel["radii"], vectorized["radii"])
+
+
+@pytest.mark.parametrize("shape", ["sphere", "sphere_w_LH", "cylinder", "cone"])
+@pytest.mark.parametrize("distribution", ["uniform", "planophile"])
+def test_numba_backend_matches_numpy_samplers(monkeypatch, shape, distribution):
+    """A seed gives the same tree with or without numba installed."""
+    pytest.importorskip("numba")
+    params = dict(
+        trunk_height=5.0,
+        trunk_radius=0.2,
+        crown_shape=shape,
+        crown_height=4.0,
+        crown_radius=2.0,
+        lai=1.0,
+        leaf_radius_params=leaf_radius_params,
+        leaf_angle_distribution=distribution,
+        position=[1.0, 2.0, 0.0],
+    )
+    monkeypatch.setattr(tree_module, "_parallel_leaves", False)
+    compiled = generate_tree(rng=np.random.default_rng(5), **params)["leaves"]
+
+    monkeypatch.setattr(tree_module, "njit", None)
+    vectorized = generate_tree(rng=np.random.default_rng(5), **params)["leaves"]
+
+    for key in ("centers", "normals"):
+        assert compiled[key].dtype == np.float32
+        np.testing.assert_allclose(compiled[key], vectorized[key], atol=1e-5)
+    np.testing.assert_array_equal(compiled["radii"], vectorized["radii"])
+
+
+def test_batch_zero_points():
+    """Requesting zero points returns an empty (0, 3) array."""
+    points = sample_points_in_crown("cylinder", 4.0, 1.5, 0)
+    assert points.shape == (0, 3)
+
+
 # ==============================================================
 # GENERATE_TREE TESTS
 # ==============================================================
@@ -146,7 +329,13 @@ def test_generate_tree_structure():
     assert "trunk" in tree
     assert "leaves" in tree
     assert isinstance(tree["trunk"], dict)
-    assert isinstance(tree["leaves"], list)
+    assert isinstance(tree["leaves"], dict)
+    n_leaves = len(tree["leaves"]["centers"])
+    assert tree["leaves"]["centers"].shape == (n_leaves, 3)
+    assert tree["leaves"]["normals"].shape == (n_leaves, 3)
+    assert tree["leaves"]["radii"].shape == (n_leaves,)
+    for key in ("centers", "normals", "radii"):
+        assert tree["leaves"][key].dtype == np.float32
 
 
 def test_generate_tree_trunk_properties():
@@ -165,7 +354,7 @@ def test_generate_tree_trunk_properties():
     trunk = tree["trunk"]
     assert trunk["height"] == 5.0
     assert trunk["radius"] == 0.3
-    np.testing.assert_array_equal(trunk["base"], np.array([1.0, 2.0, 0.0]))
+    assert trunk["base"] == (1.0, 2.0, 0.0)
 
 
 def test_generate_tree_leaves_positions_within_crown():
@@ -184,8 +373,7 @@ def test_generate_tree_leaves_positions_within_crown():
         leaf_angle_distribution="uniform",
         position=[0.0, 0.0, 0.0],
     )
-    for leaf in tree["leaves"]:
-        x, y, z = leaf["center"]
+    for x, y, z in tree["leaves"]["centers"]:
         r_xy = np.sqrt(x**2 + y**2)
         assert 0 <= z <= trunk_height + crown_height
         assert r_xy <= crown_radius
@@ -204,10 +392,9 @@ def test_generate_tree_leaves_normals():
         leaf_angle_distribution="uniform",
         position=[0.0, 0.0, 0.0],
     )
-    for leaf in tree["leaves"]:
-        normal = leaf["normal"]
-        assert isinstance(normal, np.ndarray)
-        np.testing.assert_allclose(np.linalg.norm(normal), 1.0, rtol=1e-6)
+    normals = tree["leaves"]["normals"]
+    assert isinstance(normals, np.ndarray)
+    np.testing.assert_allclose(np.linalg.norm(normals, axis=1), 1.0, rtol=1e-6)
 
 
 def test_generate_tree_leaf_radius_within_bounds():
@@ -223,9 +410,9 @@ def test_generate_tree_leaf_radius_within_bounds():
         leaf_angle_distribution="spherical",
         position=[0.0, 0.0, 0.0],
     )
-    for leaf in tree["leaves"]:
-        r = leaf["radius"]
-        assert leaf_radius_params["min"] <= r <= leaf_radius_params["max"]
+    radii = tree["leaves"]["radii"]
+    assert np.all(radii >= leaf_radius_params["min"])
+    assert np.all(radii <= leaf_radius_params["max"])
 
 
 def test_generate_tree_number_of_leaves_matches_lai():
@@ -233,9 +420,7 @@ def test_generate_tree_number_of_leaves_matches_lai():
     crown_radius = 2.0
     lai = 1.5
     mean_leaf_radius = leaf_radius_params["mean"]
-    expected_n_leaves = int(
-        lai * np.pi * crown_radius**2 / (np.pi * mean_leaf_radius**2)
-    )
+    expected_n_leaves = int(lai * (crown_radius / mean_leaf_radius) ** 2)
     tree = generate_tree(
         trunk_height=5.0,
         trunk_radius=0.2,
@@ -247,4 +432,152 @@ def test_generate_tree_number_of_leaves_matches_lai():
         leaf_angle_distribution="planophile",
         position=[0.0, 0.0, 0.0],
     )
-    assert len(tree["leaves"]) == expected_n_leaves
+    assert len(tree["leaves"]["centers"]) == expected_n_leaves
+
+
+def test_generate_tree_zero_lai_has_no_leaves():
+    """LAI of zero yields empty leaf arrays without drawing random numbers."""
+    rng = np.random.default_rng(0)
+    state = rng.bit_generator.state
+    tree = generate_tree(
+        trunk_height=5.0,
+        trunk_radius=0.2,
+        crown_shape="sphere",
+        crown_height=4.0,
+        crown_radius=2.0,
+        lai=0.0,
+        leaf_radius_params=leaf_radius_params,
+        leaf_angle_distribution="uniform",
+        position=[0.0, 0.0, 0.0],
+        rng=rng,
+    )
+    assert tree["leaves"]["centers"].shape == (0, 3)
+    assert tree["leaves"]["normals"].shape == (0, 3)
+    assert tree["leaves"]["radii"].shape == (0,)
+    assert rng.bit_generator.state == state
+
+
+def test_generate_trees_total_leaf_count():
+    """Generating 8 trees in parallel yields the sum of their LAI leaf counts."""
+    params_list = [
+        dict(
+            trunk_height=5.0,
+            trunk_radius=0.2,
+            crown_shape="cone",
+            crown_height=4.0,
+            crown_radius=1.0 + 0.1 * i,
+            lai=1.0,
+            leaf_radius_params=leaf_radius_params,
+            leaf_angle_distribution="uniform",
+            position=[float(i), 0.0, 0.0],
+        )
+        for i in range(8)
+    ]
+    trees = generate_trees(params_list, n_jobs=2, seed=3)
+    expected = sum(
+        int(p["lai"] * (p["crown_radius"] / leaf_radius_params["mean"]) ** 2)
+        for p in params_list
+    )
+    assert len(trees) == 8
+    assert sum(len(tree["leaves"]["radii"]) for tree in trees) == expected
+
+
+def test_generate_trees_numba_parallel_backend_runs_serially(monkeypatch):
+    """With the parallel leaf kernels, trees are not spread over processes."""
+    pytest.importorskip("numba")
+    params_list = [
+        dict(
+            trunk_height=5.0,
+            trunk_radius=0.2,
+            crown_shape="sphere",
+            crown_height=4.0,
+            crown_radius=1.0,
+            lai=1.0,
+            leaf_radius_params=leaf_radius_params,
+            leaf_angle_distribution="uniform",
+            position=[float(i), 0.0, 0.0],
+        )
+        for i in range(3)
+    ]
+    monkeypatch.setattr(tree_module, "_parallel_leaves", False)
+    monkeypatch.setattr(tree_module, "_leaf_threads_started", False)
+    monkeypatch.setattr(tree_module, "ProcessPoolExecutor", None)
+    set_backend("numba_parallel")
+    try:
+        trees_a = generate_trees(params_list, n_jobs=2, seed=3)
+        trees_b = generate_trees(params_list, n_jobs=1, seed=3)
+    finally:
+        set_backend("numpy")
+    for tree_a, tree_b in zip(trees_a, trees_b):
+        for key in ("centers", "normals", "radii"):
+            np.testing.assert_array_equal(tree_a["leaves"][key], tree_b["leaves"][key])
+
+
+def test_generate_trees_spawns_workers_after_numba_parallel(monkeypatch):
+    """Once numba threads may run, worker processes are spawned, not forked."""
+    contexts = []
+
+    class RecordingExecutor:
+        def __init__(self, max_workers, mp_context=None):
+            contexts.append(mp_context)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def map(self, fn, *iterables, chunksize=1):
+            return map(fn, *iterables)
+
+    params = dict(
+        trunk_height=5.0,
+        trunk_radius=0.2,
+        crown_shape="sphere",
+        crown_height=4.0,
+        crown_radius=1.0,
+        lai=0.5,
+        leaf_radius_params=leaf_radius_params,
+        leaf_angle_distribution="uniform",
+    )
+    params_list = [dict(params, position=[float(i), 0.0, 0.0]) for i in range(2)]
+    monkeypatch.setattr(tree_module, "ProcessPoolExecutor", RecordingExecutor)
+    monkeypatch.setattr(tree_module, "_leaf_threads_started", False)
+    generate_trees(params_list, n_jobs=2, seed=3)
+    monkeypatch.setattr(tree_module, "_leaf_threads_started", True)
+    generate_trees(params_list, n_jobs=2, seed=3)
+
+    assert contexts[0] is None
+    assert contexts[1].get_start_method() == "spawn"
+
+
+def test_leaf_view_matches_leaf_arrays():
+    """LeafView exposes each row of the leaf arrays as a per-leaf dict."""
+    tree = generate_tree(
+        trunk_height=5.0,
+        trunk_radius=0.2,
+        crown_shape="cylinder",
+        crown_height=4.0,
+        crown_radius=1.0,
+        lai=0.5,
+        leaf_radius_params=leaf_radius_params,
+        leaf_angle_distribution="uniform",
+        position=[0.0, 0.0, 0.0],
+    )
+    leaves = tree["leaves"]
+    view = LeafView(leaves)
+    assert len(view) == len(leaves["radii"])
+    for i, leaf in enumerate(view):
+        np.testing.assert_array_equal(leaf["center"], leaves["centers"][i])
+        np.testing.assert_array_equal(leaf["normal"], leaves["normals"][i])
+        assert leaf["radius"] == leaves["radii"][i]
+        assert leaf["center"][2] >= 5.0
+
+    with pytest.raises(ValueError):
+        view[0]["center"][0] = 9.0
+    assert leaves["centers"].flags.writeable
+
+    as_list = view.to_list()
+    assert len(as_list) == len(view)
+    assert as_list[0]["center"] == leaves["centers"][0].tolist()
+    assert isinstance(as_list[0]["radius"], float)
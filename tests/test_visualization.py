@@ -0,0 +1,233 @@
+# tests/test_visualization.py
+
+# ==============================================================
+# IMPORTS
+# ==============================================================
+
+import json
+import sys
+import types
+import numpy as np
+import plotly.graph_objects as go
+import pytest
+from forest_stand_generator_3D.export import export_forest_stand_to_json
+from forest_stand_generator_3D.visualization import (
+    _cylinder_faces,
+    _disk_faces,
+    _instance_faces,
+    plot_forest_stand,
+    plot_forest_stand_piviz,
+    plot_forest_top_view,
+)
+
+
+def loop_cylinder_faces(resolution):
+    """Faces of one capped cylinder, built face by face."""
+    faces = []
+    for t in range(resolution):
+        b0, b1 = t, (t + 1) % resolution
+        t0, t1 = t + resolution, (t + 1) % resolution + resolution
+        faces += [(b0, b1, t1), (b0, t1, t0)]
+    for t in range(resolution):
+        faces.append((2 * resolution, t, (t + 1) % resolution))
+    for t in range(resolution):
+        faces.append(
+            (2 * resolution + 1, t + resolution, (t + 1) % resolution + resolution)
+        )
+    return faces
+
+
+def loop_disk_faces(resolution):
+    """Triangle fan of one disk, built face by face."""
+    return [(0, t, t % resolution + 1) for t in range(1, resolution + 1)]
+
+
+def loop_instance_faces(faces, n_instances, n_vertices):
+    """One mesh's faces offset into each instance's vertices, instance by instance."""
+    triangles = set()
+    for n in range(n_instances):
+        offset = n * n_vertices
+        triangles |= {(a + offset, b + offset, c + offset) for a, b, c in faces}
+    return triangles
+
+
+@pytest.fixture
+def shown_figures(monkeypatch):
+    """Capture figures instead of opening them in a browser."""
+    figures = []
+    monkeypatch.setattr(go.Figure, "show", lambda fig, *a, **k: figures.append(fig))
+    return figures
+
+
+@pytest.fixture
+def piviz_calls(monkeypatch):
+    """Install a stand-in `piviz` that renders one frame and records draw calls."""
+    calls = {}
+
+    class PiVizFX:
+        pass
+
+    class PiVizStudio:
+        def __init__(self, scene_fx):
+            self.scene_fx = scene_fx
+
+        def run(self):
+            self.scene_fx.render(0.0, 0.0)
+
+    def recorder(name):
+        return lambda *arrays, **kwargs: calls.setdefault(name, (arrays, kwargs))
+
+    pgfx = types.SimpleNamespace(
+        draw_cylinders_batch=recorder("cylinders"),
+        draw_spheres_batch=recorder("spheres"),
+    )
+    piviz = types.ModuleType("piviz")
+    piviz.PiVizFX, piviz.PiVizStudio, piviz.pgfx = PiVizFX, PiVizStudio, pgfx
+    monkeypatch.setitem(sys.modules, "piviz", piviz)
+    return calls
+
+
+# ==============================================================
+# PLOT TESTS
+# ==============================================================
+
+
+def test_plots_accept_json_reloaded_stand(tmp_path, shown_figures, stand):
+    """A stand written to JSON and loaded back (plain lists) can be plotted."""
+    export_forest_stand_to_json(stand, tmp_path / "stand.json")
+    with open(tmp_path / "stand.json") as f:
+        reloaded = json.load(f)
+
+    plot_forest_stand(reloaded, 10.0, 10.0)
+    plot_forest_top_view(reloaded, 10.0, 10.0)
+
+    # trunks + one leaf trace per leafy tree, in both views
+    assert len(shown_figures[0].data) == 3
+    assert len(shown_figures[1].data) == 3
+
+
+def test_leaf_disks_lie_in_leaf_planes(shown_figures, stand):
+    """Each leaf is one disk of its radius, in the plane normal to the leaf."""
+    resolution = 12
+    plot_forest_stand(stand, 10.0, 10.0, resolution=resolution)
+
+    # trunks, then one leaf trace per leafy tree
+    fig = shown_figures[0]
+    assert len(fig.data) == 3
+    leafy = [tree for tree in stand if len(tree["leaves"]["radii"])]
+
+    for trace, tree in zip(fig.data[1:], leafy):
+        leaves = tree["leaves"]
+        vertices = np.stack([trace.x, trace.y, trace.z], axis=-1)
+        vertices = vertices.reshape(len(leaves["radii"]), resolution + 1, 3)
+
+        np.testing.assert_allclose(vertices[:, 0], leaves["centers"])
+        offsets = vertices[:, 1:] - vertices[:, :1]
+        np.testing.assert_allclose(
+            np.linalg.norm(offsets, axis=-1),
+            np.broadcast_to(leaves["radii"][:, None], offsets.shape[:2]),
+            rtol=1e-4,
+        )
+        np.testing.assert_allclose(
+            np.einsum("lvc,lc->lv", offsets, leaves["normals"]), 0.0, atol=1e-5
+        )
+
+
+def test_trunks_share_one_mesh_trace(shown_figures, stand):
+    """All trunks are one Mesh3d trace holding one capped cylinder per tree."""
+    resolution = 12
+    plot_forest_stand(stand, 10.0, 10.0, resolution=resolution)
+
+    trunks = [trace for trace in shown_figures[0].data if trace.name == "Trunks"]
+    assert len(trunks) == 1
+    trace = trunks[0]
+
+    n_vertices = 2 * resolution + 2
+    vertices = np.stack([trace.x, trace.y, trace.z], axis=-1)
+    vertices = vertices.reshape(len(stand), n_vertices, 3)
+    assert len(trace.i) == len(stand) * 4 * resolution
+
+    for tree, cylinder in zip(stand, vertices):
+        trunk = tree["trunk"]
+        base = np.asarray(trunk["base"], dtype=np.float32)
+        top = base + [0.0, 0.0, trunk["height"]]
+        np.testing.assert_allclose(cylinder[2 * resolution], base, atol=1e-6)
+        np.testing.assert_allclose(cylinder[2 * resolution + 1], top, atol=1e-6)
+
+        # bottom ring at the base, top ring at the top, both at the trunk radius
+        rings = cylinder[: 2 * resolution]
+        np.testing.assert_allclose(
+            np.hypot(rings[:, 0] - base[0], rings[:, 1] - base[1]),
+            trunk["radius"],
+            rtol=1e-5,
+        )
+        np.testing.assert_allclose(rings[:resolution, 2], base[2])
+        np.testing.assert_allclose(rings[resolution:, 2], top[2])
+
+    # every face stays within its own trunk's vertices
+    faces = np.stack([trace.i, trace.j, trace.k], axis=-1)
+    owner = faces // n_vertices
+    assert np.all(owner == owner[:, :1])
+    np.testing.assert_array_equal(
+        np.bincount(owner[:, 0]), [4 * resolution] * len(stand)
+    )
+
+
+@pytest.mark.parametrize("resolution", [3, 8, 20])
+def test_instanced_faces_match_per_mesh_loop(resolution):
+    """Cached topology, instanced once, gives the triangles of a per-mesh loop."""
+    n = 5
+    cases = [
+        (_cylinder_faces, loop_cylinder_faces, 2 * resolution + 2),
+        (_disk_faces, loop_disk_faces, resolution + 1),
+    ]
+    for cached, loop, n_vertices in cases:
+        faces = cached(resolution)
+        assert cached(resolution) is faces
+        assert all(f.dtype == np.int32 and not f.flags.writeable for f in faces)
+
+        i, j, k = _instance_faces(faces, n, n_vertices)
+        triangles = list(zip(i.tolist(), j.tolist(), k.tolist()))
+        assert len(triangles) == n * len(loop(resolution))
+        assert set(triangles) == loop_instance_faces(loop(resolution), n, n_vertices)
+
+
+def test_piviz_draws_contiguous_instance_buffers(tmp_path, piviz_calls, stand):
+    """Trunks and leaves go to piviz as C-contiguous float32 instance buffers."""
+    export_forest_stand_to_json(stand, tmp_path / "stand.json")
+    with open(tmp_path / "stand.json") as f:
+        reloaded = json.load(f)
+
+    plot_forest_stand_piviz(reloaded, leaf_detail=4, trunk_detail=8)
+
+    (starts, ends, trunk_radii, trunk_colors), kwargs = piviz_calls["cylinders"]
+    assert kwargs == {"detail": 8}
+    np.testing.assert_allclose(starts, [tree["trunk"]["base"] for tree in stand])
+    np.testing.assert_allclose(
+        ends[:, 2] - starts[:, 2], [tree["trunk"]["height"] for tree in stand]
+    )
+    np.testing.assert_allclose(trunk_radii, [tree["trunk"]["radius"] for tree in stand])
+
+    (centers, leaf_radii, leaf_colors), kwargs = piviz_calls["spheres"]
+    assert kwargs == {"detail": 4}
+    np.testing.assert_array_equal(
+        centers, np.concatenate([tree["leaves"]["centers"] for tree in stand])
+    )
+    np.testing.assert_array_equal(
+        leaf_radii, np.concatenate([tree["leaves"]["radii"] for tree in stand])
+    )
+
+    assert trunk_colors.shape == (len(stand), 3)
+    assert leaf_colors.shape == (len(leaf_radii), 3)
+    buffers = (
+        starts,
+        ends,
+        trunk_radii,
+        trunk_colors,
+        centers,
+        leaf_radii,
+        leaf_colors,
+    )
+    for array in buffers:
+        assert array.dtype == np.float32
+        assert array.flags.c_contiguous